@@ -1,6 +1,16 @@
 """GUI package for Tempera MIDI controller."""
 
-from gui.app import run_app
-from gui.adapter import TemperaAdapter, StateManager
-
+# Use lazy imports so that importing a submodule (e.g. gui.envelope.envelope)
+# does not pull in PySide6 widgets, qasync and the full window
 __all__ = ['run_app', 'TemperaAdapter', 'StateManager']
+
+
+def __getattr__(name):
+    """Lazy import for GUI entry points."""
+    if name == 'run_app':
+        from gui.app import run_app
+        return run_app
+    elif name in ('TemperaAdapter', 'StateManager'):
+        from gui.adapter import TemperaAdapter, StateManager
+        return TemperaAdapter if name == 'TemperaAdapter' else StateManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
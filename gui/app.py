@@ -12,8 +12,6 @@ from PySide6.QtWidgets import (
     QStatusBar, QMessageBox, QPushButton, QInputDialog
 )
 
-import qasync
-
 from gui.adapter import TemperaAdapter
 from gui.widgets import (
     CellGrid, EmitterPanel, TrackPanel, GlobalPanel, TransportPanel,
@@ -76,6 +74,8 @@ class MainWindow(QMainWindow):
         # Menu bar
         menu_bar = self.menuBar()
         file_menu = menu_bar.addMenu('&File')
+        # The menu actions own Ctrl+S / Ctrl+O (they are not in SHARED_KEYS),
+        # so the menu shows the accelerators and no other shortcut competes
         file_menu.addAction('&Save Canvas...', self._on_save_canvas, 'Ctrl+S')
         file_menu.addAction('&Load Canvas...', self._on_load_canvas, 'Ctrl+O')
 
@@ -214,19 +214,11 @@ class MainWindow(QMainWindow):
     def _setup_shortcuts(self):
         """Set up keyboard shortcuts.
 
-        Note: Section navigation (Q/E/T/G) is handled by NavigationManager.
-        ShortcutManager only handles non-conflicting shortcuts.
+        Note: ShortcutManager registers no defaults. Navigation, emitter
+        selection, stop and undo/redo keys are owned by NavigationManager
+        (SHARED_KEYS), and Ctrl+S/Ctrl+O by the File menu actions.
         """
         self._shortcuts = ShortcutManager(self)
-        self._shortcuts.setup_defaults(
-            select_emitter=self._on_select_emitter,
-            play=self._on_play,
-            stop=self._on_stop,
-            undo=self._on_undo,
-            redo=self._on_redo,
-            save_canvas=self._on_save_canvas,
-            load_canvas=self._on_load_canvas,
-        )
 
     def _setup_navigation(self):
         """Set up the keyboard navigation manager."""
@@ -260,8 +252,6 @@ class MainWindow(QMainWindow):
         self._nav.set_callback('stop', self._on_stop)
         self._nav.set_callback('undo', self._on_undo)
         self._nav.set_callback('redo', self._on_redo)
-        self._nav.set_callback('save_canvas', self._on_save_canvas)
-        self._nav.set_callback('load_canvas', self._on_load_canvas)
 
     def _connect_signals(self):
         """Connect widget signals to handlers."""
@@ -296,9 +286,12 @@ class MainWindow(QMainWindow):
         # State manager listener for undo/redo updates
         self._adapter.state.add_listener(self._on_state_changed)
 
-        # Envelope panel
-        self._envelope_panel.envelopeChanged.connect(self._on_envelope_changed)
-        self._envelope_panel.enabledToggled.connect(self._on_envelope_toggled)
+        # Envelope panel. Emitted per drawing flush from the GUI thread, so
+        # connect directly rather than letting Qt pick per emit.
+        self._envelope_panel.envelopeChanged.connect(
+            self._on_envelope_changed, Qt.ConnectionType.DirectConnection)
+        self._envelope_panel.enabledToggled.connect(
+            self._on_envelope_toggled, Qt.ConnectionType.DirectConnection)
 
         # Envelope position callback for playhead
         self._adapter.set_envelope_position_callback(self._on_envelope_position)
@@ -340,29 +333,36 @@ class MainWindow(QMainWindow):
     def _sync_ui_from_state(self):
         """Synchronize UI from current state."""
         state = self._adapter.state.state
+        emitters = state['emitters']
+        tracks = state['tracks']
+        global_params = state['global']
+        cells = state['cells']
+        active_emitter = state['active_emitter']
+        emitter_panel = self._emitter_panel
+        cell_grid = self._cell_grid
 
         # Sync emitter parameters
-        for emitter_num, params in state['emitters'].items():
-            self._emitter_panel.set_all_parameters(emitter_num, params)
+        for emitter_num, params in emitters.items():
+            emitter_panel.set_all_parameters(emitter_num, params)
 
         # Sync track volumes
-        track_volumes = {t: p['volume'] for t, p in state['tracks'].items()}
+        track_volumes = {t: p['volume'] for t, p in tracks.items()}
         self._track_panel.set_all_volumes(track_volumes)
 
         # Sync global parameters
-        self._global_panel.set_all_parameters(state['global'])
+        self._global_panel.set_all_parameters(global_params)
 
         # Sync cells based on current grid mode
         if self._grid_mode == 'hardware':
-            self._cell_grid.set_all_cells(state['cells'])
+            cell_grid.set_all_cells(cells)
         elif self._grid_mode == 'column':
             self._load_column_patterns_to_grid()
         else:  # 'grid'
             self._load_grid_pattern_to_grid()
 
         # Sync active emitter
-        self._emitter_panel.select_emitter(state['active_emitter'])
-        self._cell_grid.set_active_emitter(state['active_emitter'])
+        emitter_panel.select_emitter(active_emitter)
+        cell_grid.set_active_emitter(active_emitter)
 
     def _update_status(self, message: str):
         """Update status bar message."""
@@ -1041,7 +1041,9 @@ class MainWindow(QMainWindow):
 
     def _on_envelope_changed(self, control_key: str, envelope):
         """Handle envelope modification from panel."""
-        self._adapter.state.set_envelope(control_key, envelope)
+        # A drawing stroke is one undo step: only its first change records it
+        record_undo = not self._envelope_panel.is_drawing
+        self._adapter.state.set_envelope(control_key, envelope, record_undo=record_undo)
 
     def _on_envelope_toggled(self, control_key: str, enabled: bool):
         """Handle envelope enable/disable from panel."""
@@ -1053,12 +1055,17 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close."""
+        self._prefs.flush()
         self._schedule_async(self._adapter.disconnect())
         event.accept()
 
 
 def run_app():
     """Run the Tempera GUI application."""
+    # qasync is only needed to drive the event loop; import it here so that
+    # importing MainWindow (e.g. in tests) does not load it
+    import qasync
+
     app = QApplication(sys.argv)
     app.setStyleSheet(MAIN_STYLESHEET)
 
@@ -1,5 +1,6 @@
 """Canvas file management for saving/loading complete Tempera state."""
 
+import hashlib
 import json
 import os
 import platform
@@ -8,6 +9,10 @@ from pathlib import Path
 
 CANVAS_FORMAT_VERSION = 1
 
+# Content hash of the last bytes written per canvas file, used to skip
+# rewriting a canvas whose serialized content has not changed.
+_save_cache: dict[Path, bytes] = {}
+
 
 def get_canvas_directory() -> Path:
     """Get the platform-appropriate canvas storage directory.
@@ -37,6 +42,9 @@ def list_canvases() -> list[str]:
 def save_canvas(name: str, state_dict: dict, metadata: dict) -> Path:
     """Save a canvas to the canvas directory.
 
+    The file is not rewritten if it still exists and its content would be
+    identical to what this process last wrote to it.
+
     Args:
         name: Canvas name (used as filename, .json appended).
         state_dict: Serialized state from StateManager.serialize_state().
@@ -51,8 +59,14 @@ def save_canvas(name: str, state_dict: dict, metadata: dict) -> Path:
         'state': state_dict,
     }
     filepath = get_canvas_directory() / f'{name}.json'
-    with open(filepath, 'w') as f:
-        json.dump(canvas, f, indent=2)
+    data = json.dumps(canvas, indent=2).encode('utf-8')
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if _save_cache.get(filepath) == digest and filepath.exists():
+        return filepath
+
+    with open(filepath, 'wb') as f:
+        f.write(data)
+    _save_cache[filepath] = digest
     return filepath
 
 
@@ -86,6 +100,7 @@ def delete_canvas(name: str) -> bool:
         True if deleted, False if not found.
     """
     filepath = get_canvas_directory() / f'{name}.json'
+    _save_cache.pop(filepath, None)
     if filepath.exists():
         filepath.unlink()
         return True
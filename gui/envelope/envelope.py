@@ -1,7 +1,8 @@
 """Envelope data model for automation curves."""
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional
 
 
 @dataclass
@@ -44,6 +45,25 @@ class Envelope:
     preset: Optional[str] = None
     per_cell: bool = False
 
+    # Point times and values as parallel lists plus per-segment lookup
+    # tables, rebuilt lazily after the points change. Segment i spans
+    # points[i] to points[i + 1] and is evaluated as
+    # slopes[i] * time + intercepts[i].
+    _times: Optional[list[float]] = field(default=None, init=False, repr=False, compare=False)
+    _values: list[float] = field(default_factory=list, init=False, repr=False, compare=False)
+    _slopes: list[float] = field(default_factory=list, init=False, repr=False, compare=False)
+    _intercepts: list[float] = field(default_factory=list, init=False, repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def version(self) -> int:
+        """Modification counter, incremented whenever the points change.
+
+        Lets views cache data derived from the points (e.g. a rendered path)
+        and detect when it is stale.
+        """
+        return self._version
+
     def add_point(self, time: float, value: float):
         """Add a point to the envelope.
 
@@ -53,14 +73,74 @@ class Envelope:
             time: Position in envelope (0.0 to 1.0)
             value: Value at this position (0.0 to 1.0)
         """
-        time = max(0.0, min(1.0, time))
-        value = max(0.0, min(1.0, value))
-        self.points.append(EnvelopePoint(time, value))
-        self.points.sort(key=lambda p: p.time)
+        self.add_points(((time, value),))
+
+    def add_points(self, points: Iterable[tuple[float, float]]):
+        """Add several points to the envelope at once.
+
+        Equivalent to calling add_point for each (time, value) pair, but
+        sorts and updates cached lookups only once.
+
+        Args:
+            points: (time, value) pairs, each 0.0 to 1.0
+        """
+        new_points = sorted(
+            (EnvelopePoint(max(0.0, min(1.0, time)), max(0.0, min(1.0, value)))
+             for time, value in points),
+            key=lambda p: p.time,
+        )
+        if not new_points:
+            return
+
+        existing = self.points
+        if not existing or new_points[0].time >= existing[-1].time:
+            # Appending in time order (as when drawing): extend the cached
+            # lookups in place rather than rebuilding them
+            existing.extend(new_points)
+            if self._times is not None:
+                self._extend_segments(new_points)
+        else:
+            existing.extend(new_points)
+            existing.sort(key=lambda p: p.time)
+            self._times = None
+        self._version += 1
 
     def clear(self):
         """Remove all points from the envelope."""
         self.points.clear()
+        self._times = None
+        self._version += 1
+
+    def _rebuild_segments(self):
+        """Precompute point columns and segment slopes/intercepts."""
+        self._times = []
+        self._values = []
+        self._slopes = []
+        self._intercepts = []
+        self._extend_segments(self.points)
+
+    def _extend_segments(self, points: list[EnvelopePoint]):
+        """Append points, sorted and after all existing ones, to the lookups."""
+        times, values = self._times, self._values
+        slopes, intercepts = self._slopes, self._intercepts
+        for point in points:
+            if times:
+                t0, v0 = times[-1], values[-1]
+                dt = point.time - t0
+                slope = (point.value - v0) / dt if dt else 0.0
+                slopes.append(slope)
+                intercepts.append(v0 - slope * t0)
+            times.append(point.time)
+            values.append(point.value)
+
+    def times_and_values(self) -> tuple[list[float], list[float]]:
+        """Get point times and values as parallel lists, sorted by time.
+
+        The lists are shared caches and must not be modified.
+        """
+        if self._times is None:
+            self._rebuild_segments()
+        return self._times, self._values
 
     def get_value_at(self, time: float) -> float:
         """Get the envelope value at a given time via linear interpolation.
@@ -76,30 +156,19 @@ class Envelope:
 
         time = max(0.0, min(1.0, time))
 
-        # Find surrounding points
-        before: Optional[EnvelopePoint] = None
-        after: Optional[EnvelopePoint] = None
+        times, values = self.times_and_values()
 
-        for point in self.points:
-            if point.time <= time:
-                before = point
-            elif after is None:
-                after = point
-                break
+        # Index of the first point after time; the point before is at i - 1
+        i = bisect_right(times, time)
 
         # Handle edge cases
-        if before is None and after is None:
-            return 1.0
-        if before is None:
-            return after.value
-        if after is None:
-            return before.value
-        if before.time == after.time:
-            return before.value
-
-        # Linear interpolation
-        t = (time - before.time) / (after.time - before.time)
-        return before.value + t * (after.value - before.value)
+        if i == 0:
+            return values[0]
+        if i == len(times) or times[i - 1] == time:
+            return values[i - 1]
+
+        # Linear interpolation along the precomputed segment
+        return self._slopes[i - 1] * time + self._intercepts[i - 1]
 
     def is_empty(self) -> bool:
         """Check if envelope has no points."""
@@ -4,7 +4,7 @@ import asyncio
 import time
 from typing import Callable, Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 
 
 class EnvelopeManager(QObject):
@@ -15,11 +15,12 @@ class EnvelopeManager(QObject):
 
     Signals:
         positionChanged(float): Emitted when position changes (0.0 to 1.0)
-        tickUpdate(): Emitted on each update tick (~60fps) when running
+        tickUpdate(float): Emitted on each update tick (~60fps) when running,
+            with the current position (0.0 to 1.0)
     """
 
     positionChanged = Signal(float)
-    tickUpdate = Signal()
+    tickUpdate = Signal(float)
 
     # Update rate (approximately 60 fps)
     UPDATE_INTERVAL_MS = 16
@@ -32,7 +33,7 @@ class EnvelopeManager(QObject):
         self._start_time: Optional[float] = None
         self._update_task: Optional[asyncio.Task] = None
 
-        # Callbacks for envelope modulation
+        # Callback for envelope modulation, connected to tickUpdate
         self._on_tick: Optional[Callable[[float], None]] = None
 
     @property
@@ -58,9 +59,17 @@ class EnvelopeManager(QObject):
     def set_tick_callback(self, callback: Optional[Callable[[float], None]]):
         """Set callback for tick updates.
 
-        The callback receives the current position (0.0 to 1.0).
+        The callback is connected to tickUpdate and receives the current
+        position (0.0 to 1.0). Any previously set callback is disconnected;
+        pass None to disconnect without setting a new one.
         """
+        if self._on_tick is not None:
+            self.tickUpdate.disconnect(self._on_tick)
         self._on_tick = callback
+        if callback is not None:
+            # The timing loop runs on the qasync event loop in the GUI
+            # thread, so ticks are delivered directly
+            self.tickUpdate.connect(callback, Qt.ConnectionType.DirectConnection)
 
     def _beats_to_seconds(self, beats: float) -> float:
         """Convert beats to seconds at current BPM."""
@@ -107,13 +116,9 @@ class EnvelopeManager(QObject):
             while self._running:
                 self._update_position()
 
-                # Emit signals
+                # Emit signals (the tick callback is connected to tickUpdate)
                 self.positionChanged.emit(self._position)
-                self.tickUpdate.emit()
-
-                # Call tick callback if set
-                if self._on_tick:
-                    self._on_tick(self._position)
+                self.tickUpdate.emit(self._position)
 
                 # Wait for next update
                 await asyncio.sleep(self.UPDATE_INTERVAL_MS / 1000.0)
@@ -1,11 +1,15 @@
 """Envelope panel widget for drawing automation curves."""
 
+from functools import lru_cache
 from typing import Optional, Union
 
-from PySide6.QtCore import Qt, Signal, QPointF
-from PySide6.QtGui import QPainter, QPen, QPainterPath, QMouseEvent, QColor
+from PySide6.QtCore import Qt, Signal, QEvent, QPointF, QRect, QTimer
+from PySide6.QtGui import (
+    QPainter, QPen, QPainterPath, QPixmap, QPolygonF, QMouseEvent, QColor
+)
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QSizePolicy,
+    QStyle, QStyleOptionFrame
 )
 
 from gui.envelope.envelope import Envelope, EnvelopePoint
@@ -13,9 +17,89 @@ from gui.envelope.envelope_presets import EnvelopePreset, generate_preset_points
 from gui.envelope.preset_button import PresetButton
 from gui.styles import (
     ENVELOPE_ACTIVE_CYAN, ENVELOPE_INACTIVE_GREY, ENVELOPE_BACKGROUND,
-    ENVELOPE_TOGGLE_ON, ENVELOPE_TOGGLE_OFF, ENVELOPE_PLAYHEAD
+    ENVELOPE_TOGGLE_ON, ENVELOPE_TOGGLE_OFF, ENVELOPE_PLAYHEAD, set_style_sheet
 )
 
+# Canvas frame styles - border color shows whether the envelope is enabled
+_CANVAS_STYLE = """
+    QFrame {{
+        background-color: {background};
+        border: 1px solid {border};
+        border-radius: 4px;
+    }}
+"""
+CANVAS_STYLE_ENABLED = _CANVAS_STYLE.format(background=ENVELOPE_BACKGROUND,
+                                            border=ENVELOPE_ACTIVE_CYAN)
+CANVAS_STYLE_DISABLED = _CANVAS_STYLE.format(background=ENVELOPE_BACKGROUND,
+                                             border=ENVELOPE_INACTIVE_GREY)
+
+# Tool button styles (ENV toggle, Pencil, Per Cell), by state and font size
+_BUTTON_STYLE_ON = """
+    QPushButton {{
+        background-color: {on};
+        border: 1px solid {on};
+        border-radius: 4px;
+        color: white;
+        font-weight: bold;
+        font-size: {font_size}px;
+    }}
+    QPushButton:hover {{
+        background-color: #5AA0E9;
+    }}
+"""
+_BUTTON_STYLE_OFF = """
+    QPushButton {{
+        background-color: {off};
+        border: 1px solid #505050;
+        border-radius: 4px;
+        color: #A0A0A0;
+        font-weight: bold;
+        font-size: {font_size}px;
+    }}
+    QPushButton:hover {{
+        background-color: #505050;
+    }}
+"""
+_BUTTON_STYLE_DISABLED = """
+    QPushButton {{
+        background-color: #353535;
+        border: 1px solid #404040;
+        border-radius: 4px;
+        color: #606060;
+        font-size: {font_size}px;
+    }}
+"""
+TOGGLE_STYLE_ON = _BUTTON_STYLE_ON.format(on=ENVELOPE_TOGGLE_ON, font_size=10)
+TOGGLE_STYLE_OFF = _BUTTON_STYLE_OFF.format(off=ENVELOPE_TOGGLE_OFF, font_size=10)
+PER_CELL_STYLE_ON = TOGGLE_STYLE_ON
+PER_CELL_STYLE_OFF = TOGGLE_STYLE_OFF
+PER_CELL_STYLE_DISABLED = _BUTTON_STYLE_DISABLED.format(font_size=10)
+PENCIL_STYLE_ON = _BUTTON_STYLE_ON.format(on=ENVELOPE_TOGGLE_ON, font_size=14)
+PENCIL_STYLE_OFF = _BUTTON_STYLE_OFF.format(off=ENVELOPE_TOGGLE_OFF, font_size=14)
+PENCIL_STYLE_DISABLED = _BUTTON_STYLE_DISABLED.format(font_size=14)
+
+# Canvas colors, resolved from their hex names once at import
+_GRID_COLOR = QColor('#333333')
+_CURVE_ACTIVE_COLOR = QColor(ENVELOPE_ACTIVE_CYAN)
+_CURVE_INACTIVE_COLOR = QColor(ENVELOPE_INACTIVE_GREY)
+_PLAYHEAD_COLOR = QColor(ENVELOPE_PLAYHEAD)
+
+
+@lru_cache(maxsize=256)
+def _format_control_name(control_key: str) -> str:
+    """Format a control key as a readable name."""
+    parts = control_key.split('.')
+    if len(parts) >= 2:
+        if parts[0] == 'emitter':
+            return f'Emitter {parts[1]} - {parts[2].replace("_", " ").title()}'
+        elif parts[0] == 'track':
+            return f'Track {parts[1]} - {parts[2].replace("_", " ").title()}'
+        elif parts[0] == 'global':
+            if len(parts) == 2:
+                return f'Global - {parts[1].replace("_", " ").title()}'
+            return f'Global {parts[1].title()} - {parts[2].replace("_", " ").title()}'
+    return control_key
+
 
 class EnvelopeCanvas(QFrame):
     """Canvas for drawing and displaying envelope curves.
@@ -32,6 +116,17 @@ class EnvelopeCanvas(QFrame):
     MIN_HEIGHT = 80
     PADDING = 8
 
+    # Minimum interval between drawing updates while dragging (~60fps)
+    DRAG_UPDATE_INTERVAL_MS = 16
+
+    # A drawn point is kept only if it moves at least this far in time or
+    # value from the previous one (roughly a pixel or two on screen)
+    MIN_DRAW_DT = 0.004
+    MIN_DRAW_DV = 0.02
+
+    # Half-width of the strip repainted around the playhead line
+    PLAYHEAD_MARGIN = 3
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._envelope: Optional[Envelope] = None
@@ -39,8 +134,43 @@ class EnvelopeCanvas(QFrame):
         self._drawing = False
         self._drawing_enabled = True  # Whether mouse drawing is allowed
         self._playhead_position: Optional[float] = None
+        self._last_playhead_x: Optional[int] = None
+        # Drawable area inside the padding, dropped on resize
+        self._drawable_rect: Optional[QRect] = None
+        # (x, y, 1/width, 1/height) of the canvas rect, held for one drag
+        self._drag_transform: Optional[tuple[float, float, float, float]] = None
+
+        # Cached curve polyline through all points, valid for one envelope
+        # version at the current canvas size
+        self._curve_polygon: Optional[QPolygonF] = None
+        self._curve_version = -1
+
+        # Pens are created once rather than on every paint
+        self._grid_pen = QPen(_GRID_COLOR)
+        self._grid_pen.setWidth(1)
+        self._curve_pen_active = QPen(_CURVE_ACTIVE_COLOR)
+        self._curve_pen_active.setWidth(1)
+        self._curve_pen_inactive = QPen(_CURVE_INACTIVE_COLOR)
+        self._curve_pen_inactive.setWidth(1)
+        self._playhead_pen = QPen(_PLAYHEAD_COLOR)
+        self._playhead_pen.setWidth(2)
+
+        # Static grid lines, rebuilt only when the canvas size changes
+        self._grid_path = QPainterPath()
+        # Frame border and grid pre-rendered for reuse on every paint;
+        # None until next needed after a resize or style change
+        self._background: Optional[QPixmap] = None
+
+        # Points drawn since the last flush; mouse moves are coalesced so
+        # envelopeChanged and repaints happen at most once per interval
+        self._pending_points: list[tuple[float, float]] = []
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setInterval(self.DRAG_UPDATE_INTERVAL_MS)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.timeout.connect(self._flush_pending)
 
         self._setup_ui()
+        self._rebuild_grid()
 
     def _setup_ui(self):
         """Set up the canvas appearance."""
@@ -48,23 +178,26 @@ class EnvelopeCanvas(QFrame):
         self.setFrameShape(QFrame.Shape.Box)
         self.setLineWidth(1)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.setMouseTracking(True)
+        # No mouse tracking: moves only matter while a button is held, and
+        # Qt delivers those regardless
         self._update_style()
 
     def _update_style(self):
         """Update the frame style based on enabled state."""
-        border_color = ENVELOPE_ACTIVE_CYAN if self._enabled else ENVELOPE_INACTIVE_GREY
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {ENVELOPE_BACKGROUND};
-                border: 1px solid {border_color};
-                border-radius: 4px;
-            }}
-        """)
+        set_style_sheet(self, CANVAS_STYLE_ENABLED if self._enabled else CANVAS_STYLE_DISABLED)
 
     def set_envelope(self, envelope: Optional[Envelope]):
         """Set the envelope to display/edit."""
-        self._envelope = envelope
+        # Commit any points still buffered for the previous envelope
+        self._flush_pending()
+        # The cached curve is keyed on the envelope version, so only a
+        # different envelope object invalidates it
+        if envelope is not self._envelope:
+            self._envelope = envelope
+            self._curve_polygon = None
+            # End any stroke so later moves don't continue it on this envelope
+            self._drawing = False
+            self._drag_transform = None
         self._enabled = envelope.enabled if envelope else False
         self._update_style()
         self.update()
@@ -78,24 +211,64 @@ class EnvelopeCanvas(QFrame):
     def set_playhead_position(self, position: Optional[float]):
         """Set playhead position (0.0-1.0) or None to hide."""
         self._playhead_position = position
-        self.update()
+
+        # Sub-pixel moves leave the drawn line where it is
+        new_x = self._playhead_x(position)
+        old_x = self._last_playhead_x
+        if new_x == old_x:
+            return
+        self._last_playhead_x = new_x
+
+        # Repaint only the strips under the old and new playhead lines
+        if old_x is not None:
+            self.update(self._playhead_rect(old_x))
+        if new_x is not None:
+            self.update(self._playhead_rect(new_x))
+
+    def _playhead_x(self, position: Optional[float]) -> Optional[int]:
+        """Get the playhead x pixel for a position, or None if not drawn."""
+        if position is None or not 0.0 <= position <= 1.0:
+            return None
+        rect = self._canvas_rect()
+        return round(rect.x() + position * rect.width())
+
+    def _playhead_rect(self, x: int) -> QRect:
+        """Get the region covered by a playhead line at x."""
+        margin = self.PLAYHEAD_MARGIN
+        return QRect(x - margin, 0, 2 * margin + 1, self.height())
 
     def clear(self):
         """Clear the envelope points."""
+        # Clearing ends any stroke, so the clear is its own edit rather than
+        # part of the stroke (e.g. right-click while drawing)
+        self._pending_points.clear()
+        self._drawing = False
+        self._drag_transform = None
         if self._envelope:
             self._envelope.clear()
             self.envelopeChanged.emit(self._envelope)
             self.update()
 
+    @property
+    def is_drawing(self) -> bool:
+        """Whether a drawing stroke is in progress.
+
+        True for envelopeChanged emitted after the first change of a stroke,
+        so receivers can treat a whole stroke as one edit.
+        """
+        return self._drawing
+
     def set_drawing_enabled(self, enabled: bool):
         """Enable or disable mouse drawing."""
         self._drawing_enabled = enabled
         self.setCursor(Qt.CursorShape.CrossCursor if enabled else Qt.CursorShape.ArrowCursor)
 
-    def _canvas_rect(self):
-        """Get the drawable area rect."""
-        return self.rect().adjusted(self.PADDING, self.PADDING,
-                                     -self.PADDING, -self.PADDING)
+    def _canvas_rect(self) -> QRect:
+        """Get the drawable area rect (cached until the next resize)."""
+        if self._drawable_rect is None:
+            self._drawable_rect = self.rect().adjusted(self.PADDING, self.PADDING,
+                                                       -self.PADDING, -self.PADDING)
+        return self._drawable_rect
 
     def _point_to_canvas(self, time: float, value: float) -> QPointF:
         """Convert envelope coordinates to canvas coordinates."""
@@ -104,71 +277,148 @@ class EnvelopeCanvas(QFrame):
         y = rect.y() + (1.0 - value) * rect.height()  # Flip Y (0 at bottom)
         return QPointF(x, y)
 
+    def _points_to_canvas(self, points: list[tuple[float, float]]) -> list[QPointF]:
+        """Convert many (time, value) pairs to canvas coordinates at once."""
+        rect = self._canvas_rect()
+        x0, width = rect.x(), rect.width()
+        y1, height = rect.y() + rect.height(), rect.height()
+        # y = rect.y() + (1 - value) * height, folded to y1 - value * height
+        return [QPointF(x0 + time * width, y1 - value * height) for time, value in points]
+
     def _canvas_to_point(self, pos: QPointF) -> tuple[float, float]:
         """Convert canvas coordinates to envelope coordinates."""
-        rect = self._canvas_rect()
-        time = (pos.x() - rect.x()) / rect.width()
-        value = 1.0 - (pos.y() - rect.y()) / rect.height()  # Flip Y
+        transform = self._drag_transform or self._make_drag_transform()
+        x0, y0, inv_width, inv_height = transform
+        time = (pos.x() - x0) * inv_width
+        value = 1.0 - (pos.y() - y0) * inv_height  # Flip Y
         return max(0.0, min(1.0, time)), max(0.0, min(1.0, value))
 
-    def paintEvent(self, event):
-        """Draw the envelope curve and playhead."""
-        super().paintEvent(event)
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
+    def _make_drag_transform(self) -> tuple[float, float, float, float]:
+        """Get the canvas rect origin and inverse size for _canvas_to_point."""
         rect = self._canvas_rect()
-
-        # Draw grid lines (light grey, subtle)
-        grid_pen = QPen(QColor('#333333'))
-        grid_pen.setWidth(1)
-        painter.setPen(grid_pen)
+        return rect.x(), rect.y(), 1.0 / rect.width(), 1.0 / rect.height()
+
+    def _get_curve_polygon(self) -> QPolygonF:
+        """Get the polyline through the envelope points, rebuilding it if stale."""
+        envelope = self._envelope
+        if self._curve_polygon is None or self._curve_version != envelope.version:
+            times, values = envelope.times_and_values()
+
+            # More points than pixel columns can't all be seen; keep every
+            # stride-th point (and always the last) so about one point per
+            # column is drawn
+            width = int(self._canvas_rect().width())
+            if 0 < width < len(times):
+                stride = -(-len(times) // width)  # ceil
+                last_time, last_value = times[-1], values[-1]
+                times, values = times[::stride], values[::stride]
+                if times[-1] != last_time:
+                    times.append(last_time)
+                    values.append(last_value)
+
+            # Through the points only; the flat extensions to the canvas
+            # edges are drawn separately
+            self._curve_polygon = QPolygonF(self._points_to_canvas(list(zip(times, values))))
+            self._curve_version = envelope.version
+        return self._curve_polygon
+
+    def _rebuild_grid(self):
+        """Rebuild the grid line path for the current canvas size.
+
+        Lines are snapped to whole pixels so they stay crisp when drawn
+        without antialiasing.
+        """
+        rect = self._canvas_rect()
+        path = QPainterPath()
 
         # Vertical grid (8 divisions = 1 step each, matching 8-step sequencer)
         for i in range(1, 8):
-            x = rect.x() + (i / 8) * rect.width()
-            painter.drawLine(QPointF(x, rect.y()), QPointF(x, rect.bottom()))
+            x = rect.x() + round(i * rect.width() / 8)
+            path.moveTo(x, rect.y())
+            path.lineTo(x, rect.bottom())
 
         # Horizontal grid (2 divisions)
         for i in range(1, 2):
-            y = rect.y() + (i / 2) * rect.height()
-            painter.drawLine(QPointF(rect.x(), y), QPointF(rect.right(), y))
-
-        # Draw envelope curve
-        if self._envelope and not self._envelope.is_empty():
-            curve_color = QColor(ENVELOPE_ACTIVE_CYAN if self._enabled else ENVELOPE_INACTIVE_GREY)
-            pen = QPen(curve_color)
-            pen.setWidth(1)
-            painter.setPen(pen)
+            y = rect.y() + round(i * rect.height() / 2)
+            path.moveTo(rect.x(), y)
+            path.lineTo(rect.right(), y)
+
+        self._grid_path = path
+
+    def resizeEvent(self, event):
+        """Invalidate cached geometry when the canvas size changes."""
+        super().resizeEvent(event)
+        self._drawable_rect = None
+        self._curve_polygon = None
+        self._rebuild_grid()
+        self._background = None
+        if self._drag_transform is not None:
+            self._drag_transform = self._make_drag_transform()
+        self._last_playhead_x = self._playhead_x(self._playhead_position)
+
+    def changeEvent(self, event):
+        """Re-render the cached background when the widget style changes."""
+        if event.type() == QEvent.Type.StyleChange:
+            self._background = None
+        super().changeEvent(event)
+
+    def _get_background(self) -> QPixmap:
+        """Get the frame and grid as a pixmap, rendering it if needed."""
+        ratio = self.devicePixelRatioF()
+        if self._background is None or self._background.devicePixelRatio() != ratio:
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+
+            # Same frame drawing as QFrame.paintEvent
+            option = QStyleOptionFrame()
+            self.initStyleOption(option)
+            self.style().drawControl(QStyle.ControlElement.CE_ShapedFrame, option, painter, self)
+
+            # Draw grid lines (light grey, subtle)
+            painter.setPen(self._grid_pen)
+            painter.drawPath(self._grid_path)
+            painter.end()
+            self._background = pixmap
+        return self._background
+
+    # Painting stays on the raster engine rather than a QOpenGLWidget: the
+    # frame's border comes from the stylesheet, playhead moves repaint only
+    # a few pixel-wide strips, and a GL surface would always redraw in full.
+    def paintEvent(self, event):
+        """Draw the envelope curve and playhead over the cached background."""
+        painter = QPainter(self)
+        painter.setClipRect(event.rect())
 
-            # Build path from points
-            path = QPainterPath()
-            points = self._envelope.points
+        rect = self._canvas_rect()
 
-            if points:
-                # Start from left edge at the same y-level as the first point
-                first_point = points[0]
-                left_edge = self._point_to_canvas(0.0, first_point.value)
-                path.moveTo(left_edge)
+        # Frame and grid. Grid and playhead are axis-aligned on whole
+        # pixels, so only the curve is antialiased.
+        painter.drawPixmap(0, 0, self._get_background())
 
-                # Draw lines through all points
-                for point in points:
-                    pos = self._point_to_canvas(point.time, point.value)
-                    path.lineTo(pos)
+        # Draw envelope curve
+        if self._envelope and not self._envelope.is_empty():
+            # Aliased while drawing for cheap interactive repaints; release
+            # triggers one antialiased redraw
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, not self._drawing)
+            painter.setPen(self._curve_pen_active if self._enabled else self._curve_pen_inactive)
 
-                # Extend to right edge at the same y-level as the last point
-                last_point = points[-1]
-                right_edge = self._point_to_canvas(1.0, last_point.value)
-                path.lineTo(right_edge)
+            polygon = self._get_curve_polygon()
+            painter.drawPolyline(polygon)
 
-                painter.drawPath(path)
+            # Extend from the edges at the first and last point's y-level.
+            # These are always horizontal, so they skip antialiasing.
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+            first, last = polygon.first(), polygon.last()
+            painter.drawLine(QPointF(rect.x(), first.y()), first)
+            painter.drawLine(last, QPointF(rect.x() + rect.width(), last.y()))
 
         # Draw playhead
-        if self._playhead_position is not None and 0.0 <= self._playhead_position <= 1.0:
-            playhead_pen = QPen(QColor(ENVELOPE_PLAYHEAD))
-            playhead_pen.setWidth(2)
-            painter.setPen(playhead_pen)
-            x = rect.x() + self._playhead_position * rect.width()
+        x = self._playhead_x(self._playhead_position)
+        if x is not None:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+            painter.setPen(self._playhead_pen)
             painter.drawLine(QPointF(x, rect.y()), QPointF(x, rect.bottom()))
 
         painter.end()
@@ -179,7 +429,9 @@ class EnvelopeCanvas(QFrame):
             return
 
         if event.button() == Qt.MouseButton.LeftButton and self._envelope:
-            self._drawing = True
+            # Convert with a fixed transform until release (refreshed only
+            # if the canvas is resized mid-drag)
+            self._drag_transform = self._make_drag_transform()
             # Clear existing points
             self._envelope.clear()
 
@@ -191,6 +443,10 @@ class EnvelopeCanvas(QFrame):
             self.drawingStarted.emit()
             self.envelopeChanged.emit(self._envelope)
             self.update()
+
+            # Set after the first change is emitted so receivers see it as the
+            # start of the stroke and later changes as its continuation
+            self._drawing = True
         elif event.button() == Qt.MouseButton.RightButton and self._envelope:
             # Right-click to clear
             self.clear()
@@ -200,16 +456,62 @@ class EnvelopeCanvas(QFrame):
         if self._drawing and self._envelope:
             time, value = self._canvas_to_point(event.position())
 
-            # Only add points that move forward in time
-            if self._envelope.points and time > self._envelope.points[-1].time:
-                self._envelope.add_point(time, value)
-                self.envelopeChanged.emit(self._envelope)
-                self.update()
+            pending = self._pending_points
+            if pending:
+                last_time, last_value = pending[-1]
+            elif self._envelope.points:
+                last = self._envelope.points[-1]
+                last_time, last_value = last.time, last.value
+            else:
+                return
+
+            # Only add points that move forward in time, and far enough from
+            # the last point to matter, so fast sweeps don't add runs of
+            # near-duplicate points
+            if time > last_time and (time - last_time >= self.MIN_DRAW_DT
+                                     or abs(value - last_value) >= self.MIN_DRAW_DV):
+                pending.append((time, value))
+                if not self._throttle_timer.isActive():
+                    self._throttle_timer.start()
+
+    def commit_pending(self):
+        """Add any buffered drawing points to the envelope now."""
+        self._flush_pending()
+
+    def _flush_pending(self):
+        """Add buffered drawing points to the envelope and notify once."""
+        self._throttle_timer.stop()
+        pending = self._pending_points
+        if not pending or not self._envelope:
+            pending.clear()
+            return
+
+        # Points are appended at the end, so extend a current cached polyline
+        # in place instead of rebuilding it, unless that would take it past
+        # one point per pixel column; it is then left stale and rebuilt
+        # decimated on the next paint
+        polygon = self._curve_polygon
+        polygon_current = (polygon is not None
+                           and self._curve_version == self._envelope.version
+                           and polygon.count() + len(pending) <= self._canvas_rect().width())
+        self._envelope.add_points(pending)
+        if polygon_current:
+            self._curve_polygon.append(self._points_to_canvas(pending))
+            self._curve_version = self._envelope.version
+        pending.clear()
+
+        self.envelopeChanged.emit(self._envelope)
+        self.update()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Stop drawing on mouse release."""
-        if event.button() == Qt.MouseButton.LeftButton:
+        if event.button() == Qt.MouseButton.LeftButton and self._drawing:
+            # Flush while still drawing so the final change is part of the stroke
+            self._flush_pending()
             self._drawing = False
+            self._drag_transform = None
+            # Repaint the curve antialiased now that drawing has finished
+            self.update()
 
 
 class EnvelopePanel(QWidget):
@@ -233,6 +535,9 @@ class EnvelopePanel(QWidget):
         # Remember last tool when ENV is toggled off, default to pencil for first use
         self._last_active_tool: Optional[Union[EnvelopePreset, str]] = 'pencil'
         self._per_cell: bool = False
+        # Last enabled state applied to the preset and pencil buttons, which
+        # only _set_drawing_controls_enabled changes
+        self._drawing_controls_enabled: Optional[bool] = None
 
         self._setup_ui()
 
@@ -304,7 +609,9 @@ class EnvelopePanel(QWidget):
 
         # Canvas
         self._canvas = EnvelopeCanvas()
-        self._canvas.envelopeChanged.connect(self._on_canvas_changed)
+        # Same-thread relay of every drawing flush
+        self._canvas.envelopeChanged.connect(
+            self._on_canvas_changed, Qt.ConnectionType.DirectConnection)
         self._canvas.drawingStarted.connect(self._on_drawing_started)
         layout.addWidget(self._canvas)
 
@@ -313,34 +620,8 @@ class EnvelopePanel(QWidget):
 
     def _update_toggle_style(self):
         """Update toggle button style based on state."""
-        if self._toggle_btn.isChecked():
-            self._toggle_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {ENVELOPE_TOGGLE_ON};
-                    border: 1px solid {ENVELOPE_TOGGLE_ON};
-                    border-radius: 4px;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: #5AA0E9;
-                }}
-            """)
-        else:
-            self._toggle_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {ENVELOPE_TOGGLE_OFF};
-                    border: 1px solid #505050;
-                    border-radius: 4px;
-                    color: #A0A0A0;
-                    font-weight: bold;
-                    font-size: 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: #505050;
-                }}
-            """)
+        style = TOGGLE_STYLE_ON if self._toggle_btn.isChecked() else TOGGLE_STYLE_OFF
+        set_style_sheet(self._toggle_btn, style)
 
     def set_control(self, control_key: Optional[str], envelope: Optional[Envelope],
                     display_name: Optional[str] = None):
@@ -351,6 +632,10 @@ class EnvelopePanel(QWidget):
             envelope: The envelope for this control
             display_name: Human-readable name to show (defaults to control_key)
         """
+        # Commit points still buffered mid-stroke while they are relayed
+        # under the control they were drawn for
+        self._canvas.commit_pending()
+
         self._current_control_key = control_key
         self._current_envelope = envelope
 
@@ -358,7 +643,7 @@ class EnvelopePanel(QWidget):
         env_was_enabled = self._toggle_btn.isChecked()
 
         if control_key and envelope:
-            self._label.setText(display_name or self._format_control_name(control_key))
+            self._label.setText(display_name or _format_control_name(control_key))
             self._toggle_btn.setEnabled(True)
             # Keep ENV in its current state, sync the envelope to match
             if env_was_enabled:
@@ -373,20 +658,6 @@ class EnvelopePanel(QWidget):
 
         self._update_toggle_style()
 
-    def _format_control_name(self, control_key: str) -> str:
-        """Format a control key as a readable name."""
-        parts = control_key.split('.')
-        if len(parts) >= 2:
-            if parts[0] == 'emitter':
-                return f'Emitter {parts[1]} - {parts[2].replace("_", " ").title()}'
-            elif parts[0] == 'track':
-                return f'Track {parts[1]} - {parts[2].replace("_", " ").title()}'
-            elif parts[0] == 'global':
-                if len(parts) == 2:
-                    return f'Global - {parts[1].replace("_", " ").title()}'
-                return f'Global {parts[1].title()} - {parts[2].replace("_", " ").title()}'
-        return control_key
-
     def set_playhead_position(self, position: Optional[float]):
         """Set the playhead position on the canvas."""
         self._canvas.set_playhead_position(position)
@@ -448,6 +719,11 @@ class EnvelopePanel(QWidget):
         if self._current_control_key:
             self.envelopeChanged.emit(self._current_control_key, envelope)
 
+    @property
+    def is_drawing(self) -> bool:
+        """Whether a drawing stroke on the canvas is in progress."""
+        return self._canvas.is_drawing
+
     @property
     def current_control_key(self) -> Optional[str]:
         """Get the current control key."""
@@ -531,16 +807,14 @@ class EnvelopePanel(QWidget):
 
         points = generate_preset_points(self._active_tool, self._per_cell)
         self._current_envelope.clear()
-        for time, value in points:
-            self._current_envelope.add_point(time, value)
+        self._current_envelope.add_points(points)
 
         # Store metadata on envelope for persistence
         self._current_envelope.preset = self._active_tool.name
         self._current_envelope.per_cell = self._per_cell
 
-        # Refresh the canvas display
+        # Refresh the canvas display (set_envelope schedules the repaint)
         self._canvas.set_envelope(self._current_envelope)
-        self._canvas.update()
 
         if self._current_control_key:
             self.envelopeChanged.emit(self._current_control_key, self._current_envelope)
@@ -548,97 +822,36 @@ class EnvelopePanel(QWidget):
     def _update_per_cell_style(self):
         """Update Per Cell button style based on state."""
         if not self._per_cell_btn.isEnabled():
-            # Disabled style
-            self._per_cell_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #353535;
-                    border: 1px solid #404040;
-                    border-radius: 4px;
-                    color: #606060;
-                    font-size: 10px;
-                }
-            """)
+            style = PER_CELL_STYLE_DISABLED
         elif self._per_cell_btn.isChecked():
-            self._per_cell_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {ENVELOPE_TOGGLE_ON};
-                    border: 1px solid {ENVELOPE_TOGGLE_ON};
-                    border-radius: 4px;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: #5AA0E9;
-                }}
-            """)
+            style = PER_CELL_STYLE_ON
         else:
-            self._per_cell_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {ENVELOPE_TOGGLE_OFF};
-                    border: 1px solid #505050;
-                    border-radius: 4px;
-                    color: #A0A0A0;
-                    font-weight: bold;
-                    font-size: 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: #505050;
-                }}
-            """)
+            style = PER_CELL_STYLE_OFF
+        set_style_sheet(self._per_cell_btn, style)
 
     def _update_pencil_style(self):
         """Update Pencil button style based on state."""
         if not self._pencil_btn.isEnabled():
-            # Disabled style
-            self._pencil_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #353535;
-                    border: 1px solid #404040;
-                    border-radius: 4px;
-                    color: #606060;
-                    font-size: 14px;
-                }
-            """)
+            style = PENCIL_STYLE_DISABLED
         elif self._pencil_btn.isChecked():
-            self._pencil_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {ENVELOPE_TOGGLE_ON};
-                    border: 1px solid {ENVELOPE_TOGGLE_ON};
-                    border-radius: 4px;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 14px;
-                }}
-                QPushButton:hover {{
-                    background-color: #5AA0E9;
-                }}
-            """)
+            style = PENCIL_STYLE_ON
         else:
-            self._pencil_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {ENVELOPE_TOGGLE_OFF};
-                    border: 1px solid #505050;
-                    border-radius: 4px;
-                    color: #A0A0A0;
-                    font-weight: bold;
-                    font-size: 14px;
-                }}
-                QPushButton:hover {{
-                    background-color: #505050;
-                }}
-            """)
+            style = PENCIL_STYLE_OFF
+        set_style_sheet(self._pencil_btn, style)
 
     def _set_drawing_controls_enabled(self, enabled: bool):
         """Enable or disable all drawing-related controls based on ENV state."""
-        # Preset buttons
-        for btn in self._preset_buttons.values():
-            btn.setEnabled(enabled)
-            btn.update_style()  # Update visual style
+        if enabled != self._drawing_controls_enabled:
+            self._drawing_controls_enabled = enabled
 
-        # Pencil button
-        self._pencil_btn.setEnabled(enabled)
-        self._update_pencil_style()
+            # Preset buttons
+            for btn in self._preset_buttons.values():
+                btn.setEnabled(enabled)
+                btn.update_style()  # Update visual style
+
+            # Pencil button
+            self._pencil_btn.setEnabled(enabled)
+            self._update_pencil_style()
 
         # Per Cell button - disabled when pencil is active (free-draw doesn't support per-cell)
         pencil_active = self._active_tool == 'pencil'
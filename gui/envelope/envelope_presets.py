@@ -1,7 +1,11 @@
 """Predefined envelope patterns."""
 import math
 from enum import Enum
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Tuple
+
+# Immutable (time, value) sequence, safe to share between callers
+PresetPoints = Tuple[Tuple[float, float], ...]
 
 
 class EnvelopePreset(Enum):
@@ -15,15 +19,18 @@ class EnvelopePreset(Enum):
     ROUNDED = "rounded"
 
 
-def generate_preset_points(preset: EnvelopePreset, per_cell: bool = False) -> List[Tuple[float, float]]:
+@lru_cache(maxsize=None)
+def generate_preset_points(preset: EnvelopePreset, per_cell: bool = False) -> PresetPoints:
     """Generate envelope points for a preset.
 
+    Results are cached; there is one per preset and mode.
+
     Args:
         preset: The preset type
         per_cell: If True, repeat pattern 8 times (once per cell/beat)
 
     Returns:
-        List of (time, value) tuples, normalized 0.0-1.0
+        Tuple of (time, value) tuples, normalized 0.0-1.0
     """
     # Generate base pattern (single occurrence)
     base_points = _get_base_points(preset)
@@ -31,42 +38,41 @@ def generate_preset_points(preset: EnvelopePreset, per_cell: bool = False) -> Li
     if not per_cell:
         return base_points
 
-    # Repeat 8 times for per-cell mode
-    repeated = []
-    for cell in range(8):
-        cell_start = cell / 8.0
-        cell_width = 1.0 / 8.0
-        for time, value in base_points:
-            repeated.append((cell_start + time * cell_width, value))
-    return repeated
+    # Repeat 8 times for per-cell mode: cell c maps time t to (c + t) / 8
+    return tuple(
+        ((cell + time) / 8.0, value)
+        for cell in range(8)
+        for time, value in base_points
+    )
+
+
+def _rounded_points(num_points: int = 20) -> PresetPoints:
+    """Top half of an ellipse - smooth curve from 0 to 1 and back."""
+    points = []
+    for i in range(num_points + 1):
+        x = i / num_points
+        # y = sqrt(1 - (2x-1)^2) gives top half of unit circle centered at (0.5, 0)
+        y = math.sqrt(max(0, 1 - (2 * x - 1) ** 2))
+        points.append((x, y))
+    return tuple(points)
+
+
+# Points for a single pattern occurrence of each preset
+_BASE_POINTS: dict[EnvelopePreset, PresetPoints] = {
+    EnvelopePreset.RAMP_UP: ((0.0, 0.0), (1.0, 1.0)),
+    EnvelopePreset.RAMP_DOWN: ((0.0, 1.0), (1.0, 0.0)),
+    # Point at top (peak in middle)
+    EnvelopePreset.TRIANGLE: ((0.0, 0.0), (0.5, 1.0), (1.0, 0.0)),
+    # Vertical flip - point at bottom (valley in middle)
+    EnvelopePreset.TRIANGLE_DOWN: ((0.0, 1.0), (0.5, 0.0), (1.0, 1.0)),
+    # Starts high, drops to low at midpoint
+    EnvelopePreset.SQUARE: ((0.0, 1.0), (0.49, 1.0), (0.5, 0.0), (1.0, 0.0)),
+    # Horizontal flip - starts low, jumps to high at midpoint
+    EnvelopePreset.SQUARE_UP: ((0.0, 0.0), (0.49, 0.0), (0.5, 1.0), (1.0, 1.0)),
+    EnvelopePreset.ROUNDED: _rounded_points(),
+}
 
 
-def _get_base_points(preset: EnvelopePreset) -> List[Tuple[float, float]]:
+def _get_base_points(preset: EnvelopePreset) -> PresetPoints:
     """Get base points for a single pattern occurrence."""
-    if preset == EnvelopePreset.RAMP_UP:
-        return [(0.0, 0.0), (1.0, 1.0)]
-    elif preset == EnvelopePreset.RAMP_DOWN:
-        return [(0.0, 1.0), (1.0, 0.0)]
-    elif preset == EnvelopePreset.TRIANGLE:
-        # Point at top (peak in middle)
-        return [(0.0, 0.0), (0.5, 1.0), (1.0, 0.0)]
-    elif preset == EnvelopePreset.TRIANGLE_DOWN:
-        # Vertical flip - point at bottom (valley in middle)
-        return [(0.0, 1.0), (0.5, 0.0), (1.0, 1.0)]
-    elif preset == EnvelopePreset.SQUARE:
-        # Starts high, drops to low at midpoint
-        return [(0.0, 1.0), (0.49, 1.0), (0.5, 0.0), (1.0, 0.0)]
-    elif preset == EnvelopePreset.SQUARE_UP:
-        # Horizontal flip - starts low, jumps to high at midpoint
-        return [(0.0, 0.0), (0.49, 0.0), (0.5, 1.0), (1.0, 1.0)]
-    elif preset == EnvelopePreset.ROUNDED:
-        # Top half of ellipse - smooth curve from 0 to 1 and back
-        points = []
-        num_points = 20
-        for i in range(num_points + 1):
-            x = i / num_points
-            # y = sqrt(1 - (2x-1)^2) gives top half of unit circle centered at (0.5, 0)
-            y = math.sqrt(max(0, 1 - (2 * x - 1) ** 2))
-            points.append((x, y))
-        return points
-    return []
+    return _BASE_POINTS.get(preset, ())
@@ -2,21 +2,58 @@
 from typing import Optional
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPen, QPainterPath, QColor
+from PySide6.QtGui import QPainter, QPen, QPainterPath, QColor, QPixmap
 from PySide6.QtWidgets import QPushButton, QWidget
 
 from gui.envelope.envelope_presets import EnvelopePreset, generate_preset_points
+from gui.styles import set_style_sheet
+
+# Button background styles by state
+PRESET_STYLE_DISABLED = """
+    QPushButton {
+        background-color: #353535;
+        border: 1px solid #404040;
+        border-radius: 4px;
+    }
+"""
+PRESET_STYLE_ON = """
+    QPushButton {
+        background-color: #4A90D9;
+        border: 1px solid #5AA0E9;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #5AA0E9;
+    }
+"""
+PRESET_STYLE_OFF = """
+    QPushButton {
+        background-color: #404040;
+        border: 1px solid #505050;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #4A4A4A;
+    }
+"""
 
 
 class PresetButton(QPushButton):
     """Button showing envelope shape preview."""
 
     BUTTON_SIZE = (40, 30)  # Width, Height
+    SHAPE_MARGIN = 6
+
+    # Shape path per preset; buttons have a fixed size, so every button of
+    # a preset draws the same path
+    _PATH_CACHE: dict[EnvelopePreset, QPainterPath] = {}
+    # Rendered shape per preset, shape color and device pixel ratio, blitted
+    # over the button background instead of stroking the path each repaint
+    _PIXMAP_CACHE: dict[tuple[EnvelopePreset, str, float], QPixmap] = {}
 
     def __init__(self, preset: EnvelopePreset, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._preset = preset
-        self._points = generate_preset_points(preset, per_cell=False)
 
         self.setCheckable(True)
         self.setFixedSize(*self.BUTTON_SIZE)
@@ -38,67 +75,69 @@ class PresetButton(QPushButton):
     def update_style(self):
         """Update button background style based on enabled and checked state."""
         if not self.isEnabled():
-            # Disabled style
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #353535;
-                    border: 1px solid #404040;
-                    border-radius: 4px;
-                }
-            """)
+            style = PRESET_STYLE_DISABLED
         elif self.isChecked():
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #4A90D9;
-                    border: 1px solid #5AA0E9;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #5AA0E9;
-                }
-            """)
+            style = PRESET_STYLE_ON
         else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #404040;
-                    border: 1px solid #505050;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #4A4A4A;
-                }
-            """)
+            style = PRESET_STYLE_OFF
+        set_style_sheet(self, style)
+
+    @classmethod
+    def _build_path(cls, preset: EnvelopePreset) -> QPainterPath:
+        """Build the shape preview path for a preset at the fixed button size."""
+        margin = cls.SHAPE_MARGIN
+        width, height = cls.BUTTON_SIZE
+        x0, y0 = margin, margin
+        w, h = width - 2 * margin, height - 2 * margin
+
+        path = QPainterPath()
+        points = generate_preset_points(preset, per_cell=False)
+        if points:
+            first = points[0]
+            path.moveTo(x0 + first[0] * w, y0 + (1.0 - first[1]) * h)
+            for time, value in points[1:]:
+                path.lineTo(x0 + time * w, y0 + (1.0 - value) * h)
+        return path
+
+    @classmethod
+    def _get_shape_pixmap(cls, preset: EnvelopePreset, color: str, ratio: float) -> QPixmap:
+        """Get the shape preview rendered in a color, rendering it if needed."""
+        key = (preset, color, ratio)
+        pixmap = cls._PIXMAP_CACHE.get(key)
+        if pixmap is None:
+            path = cls._PATH_CACHE.get(preset)
+            if path is None:
+                path = cls._PATH_CACHE[preset] = cls._build_path(preset)
+
+            width, height = cls.BUTTON_SIZE
+            pixmap = QPixmap(round(width * ratio), round(height * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            pen = QPen(QColor(color))
+            pen.setWidth(2)
+            painter.setPen(pen)
+            painter.drawPath(path)
+            painter.end()
+
+            cls._PIXMAP_CACHE[key] = pixmap
+        return pixmap
 
     def paintEvent(self, event):
         """Draw button background and envelope shape."""
         super().paintEvent(event)
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw envelope shape
-        rect = self.rect().adjusted(6, 6, -6, -6)
         if not self.isEnabled():
-            color = QColor('#505050')  # Dimmed when disabled
+            color = '#505050'  # Dimmed when disabled
         elif self.isChecked():
-            color = QColor('#FFFFFF')
+            color = '#FFFFFF'
         else:
-            color = QColor('#A0A0A0')
-        pen = QPen(color)
-        pen.setWidth(2)
-        painter.setPen(pen)
-
-        if self._points:
-            path = QPainterPath()
-            first = self._points[0]
-            x = rect.x() + first[0] * rect.width()
-            y = rect.y() + (1.0 - first[1]) * rect.height()
-            path.moveTo(x, y)
-
-            for time, value in self._points[1:]:
-                x = rect.x() + time * rect.width()
-                y = rect.y() + (1.0 - value) * rect.height()
-                path.lineTo(x, y)
-
-            painter.drawPath(path)
+            color = '#A0A0A0'
+        pixmap = self._get_shape_pixmap(self._preset, color, self.devicePixelRatioF())
 
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
         painter.end()
@@ -42,9 +42,17 @@ class Preferences(QObject):
         super().__init__(parent)
         self._settings = QSettings('Tempera', 'MIDI')
 
-    @property
-    def keyboard_layout(self) -> KeyboardLayout:
-        """Get current keyboard layout preference."""
+        # Current values, read from QSettings once and kept in sync by the
+        # setters so property reads don't go back to the settings store
+        self._keyboard_layout = self._read_keyboard_layout()
+        self._hints_visible = bool(self._settings.value(
+            self.KEY_HINTS_VISIBLE,
+            self.DEFAULT_HINTS_VISIBLE,
+            type=bool
+        ))
+
+    def _read_keyboard_layout(self) -> KeyboardLayout:
+        """Read the stored keyboard layout, falling back to the default."""
         value = self._settings.value(
             self.KEY_KEYBOARD_LAYOUT,
             self.DEFAULT_KEYBOARD_LAYOUT.value
@@ -54,38 +62,39 @@ class Preferences(QObject):
         except ValueError:
             return self.DEFAULT_KEYBOARD_LAYOUT
 
+    @property
+    def keyboard_layout(self) -> KeyboardLayout:
+        """Get current keyboard layout preference."""
+        return self._keyboard_layout
+
     @keyboard_layout.setter
     def keyboard_layout(self, layout: KeyboardLayout):
         """Set keyboard layout preference."""
-        if layout != self.keyboard_layout:
+        if layout != self._keyboard_layout:
+            self._keyboard_layout = layout
             self._settings.setValue(self.KEY_KEYBOARD_LAYOUT, layout.value)
-            self._settings.sync()
             self.keyboardLayoutChanged.emit(layout)
 
     @property
     def hints_visible(self) -> bool:
         """Get hints visibility preference."""
-        return self._settings.value(
-            self.KEY_HINTS_VISIBLE,
-            self.DEFAULT_HINTS_VISIBLE,
-            type=bool
-        )
+        return self._hints_visible
 
     @hints_visible.setter
     def hints_visible(self, visible: bool):
         """Set hints visibility preference."""
-        if visible != self.hints_visible:
+        if visible != self._hints_visible:
+            self._hints_visible = visible
             self._settings.setValue(self.KEY_HINTS_VISIBLE, visible)
-            self._settings.sync()
             self.hintsVisibleChanged.emit(visible)
 
     def toggle_hints(self):
         """Toggle hints visibility."""
-        self.hints_visible = not self.hints_visible
+        self.hints_visible = not self._hints_visible
 
     def toggle_layout(self):
         """Toggle between left-hand and right-hand layouts."""
-        if self.keyboard_layout == KeyboardLayout.LEFT_HAND:
+        if self._keyboard_layout == KeyboardLayout.LEFT_HAND:
             self.keyboard_layout = KeyboardLayout.RIGHT_HAND
         else:
             self.keyboard_layout = KeyboardLayout.LEFT_HAND
@@ -94,6 +103,15 @@ class Preferences(QObject):
         """Reset all preferences to defaults."""
         self.keyboard_layout = self.DEFAULT_KEYBOARD_LAYOUT
         self.hints_visible = self.DEFAULT_HINTS_VISIBLE
+        self.flush()
+
+    def flush(self):
+        """Write pending preference changes to persistent storage.
+
+        Setters only update QSettings in memory; QSettings writes them back
+        periodically, and this forces it (e.g. on app shutdown).
+        """
+        self._settings.sync()
 
 
 # Singleton instance for global access
@@ -85,8 +85,6 @@ SHARED_KEYS = {
     'stop': 'Escape',
     'undo': 'Ctrl+Z',
     'redo': 'Ctrl+Shift+Z',
-    'save_canvas': 'Ctrl+S',
-    'load_canvas': 'Ctrl+O',
     'toggle_hints': '?',
     'toggle_hints_alt': 'F1',
 }
@@ -99,18 +97,12 @@ class ShortcutManager:
     Uses QShortcut which works alongside mouse events without blocking,
     enabling concurrent keyboard + mouse input.
 
-    Default bindings:
-    - 1-4: Select emitter 1-4
-    - Space/Return: Play note
-    - Escape: Stop
-    - E: Focus emitter panel
-    - C: Focus cell grid
-    - T: Focus track panel
-    - G: Focus global panel
-    - Ctrl+Z: Undo
-    - Ctrl+Shift+Z: Redo
-    - Ctrl+S: Save canvas
-    - Ctrl+O: Load canvas
+    It creates no bindings of its own. Emitter selection (1-4), stop
+    (Escape), undo/redo (Ctrl+Z/Ctrl+Shift+Z) and the hint toggles are
+    owned by NavigationManager via SHARED_KEYS, section and grid keys by
+    NavigationManager itself, and save/load (Ctrl+S/Ctrl+O) by the File
+    menu actions. Binding any of those keys here as well would make Qt
+    treat them as ambiguous and fire neither.
     """
 
     def __init__(self, parent: QWidget):
@@ -156,47 +148,6 @@ class ShortcutManager:
         for shortcut in self._shortcuts.values():
             shortcut.setEnabled(enabled)
 
-    def setup_defaults(
-        self,
-        select_emitter: Callable[[int], None],
-        play: Callable[[], None],
-        stop: Callable[[], None],
-        undo: Callable[[], None],
-        redo: Callable[[], None],
-        save_canvas: Callable[[], None],
-        load_canvas: Callable[[], None],
-    ):
-        """
-        Set up all default shortcuts.
-
-        Note: Section navigation (Q/E/T/G) and emitter selection (1-4) are
-        handled by NavigationManager via SHARED_KEYS, not here.
-
-        Args:
-            select_emitter: Callback for emitter selection (receives emitter num 1-4)
-            play: Callback for play action
-            stop: Callback for stop action
-            undo: Callback for undo
-            redo: Callback for redo
-            save_canvas: Callback for save canvas
-            load_canvas: Callback for load canvas
-        """
-        # Note: Emitter selection (1-4 keys) is handled by NavigationManager
-        # via SHARED_KEYS to avoid duplicate QShortcut registration which
-        # causes Qt to treat shortcuts as ambiguous and fire neither.
-
-        # Transport - Note: Space/Return may conflict with NavigationManager
-        # so we only register Escape for stop here
-        self.register('stop', 'Escape', stop)
-
-        # Edit
-        self.register('undo', 'Ctrl+Z', undo)
-        self.register('redo', 'Ctrl+Shift+Z', redo)
-
-        # File
-        self.register('save_canvas', 'Ctrl+S', save_canvas)
-        self.register('load_canvas', 'Ctrl+O', load_canvas)
-
     def get_shortcut_text(self, name: str) -> str:
         """Get the key sequence text for a shortcut."""
         if name in self._shortcuts:
@@ -235,6 +186,24 @@ class NavigationManager(QObject):
 
     # Section order for Tab navigation
     SECTION_ORDER = [Section.GRID, Section.EMITTER, Section.TRACKS, Section.GLOBAL]
+    _SECTION_INDEX = {section: i for i, section in enumerate(SECTION_ORDER)}
+
+    # Mode reached by toggling focus (F / Return) from each mode: enter
+    # deeper from SECTION and SUBSECTION, exit one level from CONTROL and VALUE
+    _FOCUS_TRANSITIONS = {
+        NavigationMode.SECTION: NavigationMode.SUBSECTION,
+        NavigationMode.SUBSECTION: NavigationMode.CONTROL,
+        NavigationMode.CONTROL: NavigationMode.SUBSECTION,
+        NavigationMode.VALUE: NavigationMode.CONTROL,
+    }
+
+    # Section names shown at the start of the navigation path
+    SECTION_NAMES = {
+        Section.GRID: 'Grid',
+        Section.EMITTER: 'Emitter',
+        Section.TRACKS: 'Tracks',
+        Section.GLOBAL: 'Global',
+    }
 
     def __init__(self, parent: QWidget):
         """
@@ -253,16 +222,46 @@ class NavigationManager(QObject):
         self._control = 0
         self._mode = NavigationMode.SECTION
 
+        # Mode and path of the last navigationPathChanged emission. The mode
+        # is part of the key because the status bar only shows the path
+        # outside SECTION mode, and e.g. 'Grid' reads the same in both
+        self._last_path: Optional[tuple[NavigationMode, str]] = None
+
         # Section structure: maps section -> list of control counts per subsection
         self._section_structure: dict[Section, list[int]] = {}
 
-        # Layout-specific shortcuts
+        # Layout-specific shortcuts: both layouts' sets, and the active one
+        self._layout_shortcuts: dict[KeyboardLayout, dict[str, QShortcut]] = {}
         self._nav_shortcuts: dict[str, QShortcut] = {}
         self._shared_shortcuts: dict[str, QShortcut] = {}
 
         # Callbacks for actions
         self._callbacks: dict[str, Callable] = {}
 
+        # Handlers for layout-specific shortcuts, by action name
+        self._nav_handlers: dict[str, Callable[[], None]] = {
+            # Section navigation
+            'section_next': lambda: self._cycle_section(1),
+            'section_prev': lambda: self._cycle_section(-1),
+            'section_grid': lambda: self.go_to_section(Section.GRID),
+            'section_emitter': lambda: self.go_to_section(Section.EMITTER),
+            'section_tracks': lambda: self.go_to_section(Section.TRACKS),
+            'section_global': lambda: self.go_to_section(Section.GLOBAL),
+            # W/S navigation (navigate within section)
+            'nav_prev': self.navigate_prev,
+            'nav_next': self.navigate_next,
+            # Value adjustment (CONTROL mode) or grid horizontal movement (GRID section)
+            'value_decrease': lambda: self._adjust_value(-1),
+            'value_increase': lambda: self._adjust_value(1),
+            'value_decrease_large': lambda: self._adjust_value(-10),
+            'value_increase_large': lambda: self._adjust_value(10),
+            # Actions
+            'toggle_focus': self._toggle_focus,
+            'toggle_cell': lambda: self.actionTriggered.emit('toggle_cell'),
+            'reset_default': lambda: self.actionTriggered.emit('reset_default'),
+            'toggle_envelope': lambda: self.actionTriggered.emit('toggle_envelope'),
+        }
+
         # Set up shared shortcuts
         self._setup_shared_shortcuts()
 
@@ -287,87 +286,55 @@ class NavigationManager(QObject):
         elif name == 'toggle_hints' or name == 'toggle_hints_alt':
             self._prefs.toggle_hints()
 
-    def _apply_layout(self, layout: KeyboardLayout):
-        """Apply keyboard layout shortcuts."""
-        # Remove existing layout-specific shortcuts
-        for shortcut in self._nav_shortcuts.values():
-            shortcut.setEnabled(False)
-            shortcut.deleteLater()
-        self._nav_shortcuts.clear()
-
-        # Get key mapping for layout
-        keys = LEFT_HAND_KEYS if layout == KeyboardLayout.LEFT_HAND else RIGHT_HAND_KEYS
-
-        # Create shortcuts for each action
+    def _build_nav_shortcuts(self, keys: dict[str, Optional[str]]) -> dict[str, QShortcut]:
+        """Create (disabled) navigation shortcuts for one layout's key mapping."""
+        shortcuts = {}
         for name, key in keys.items():
             if key:
                 shortcut = QShortcut(QKeySequence(key), self._parent)
                 shortcut.setContext(Qt.ShortcutContext.WindowShortcut)
-                # Use default argument to capture value at creation time
-                shortcut.activated.connect(lambda n=name: self._on_nav_shortcut(n))
-                self._nav_shortcuts[name] = shortcut
+                shortcut.setEnabled(False)
+                # Connect straight to the action's handler
+                shortcut.activated.connect(self._nav_handlers[name])
+                shortcuts[name] = shortcut
+        return shortcuts
+
+    def _apply_layout(self, layout: KeyboardLayout):
+        """Apply keyboard layout shortcuts."""
+        # Both layouts' shortcuts are created once; switching layouts just
+        # swaps which set is enabled
+        if not self._layout_shortcuts:
+            self._layout_shortcuts = {
+                KeyboardLayout.LEFT_HAND: self._build_nav_shortcuts(LEFT_HAND_KEYS),
+                KeyboardLayout.RIGHT_HAND: self._build_nav_shortcuts(RIGHT_HAND_KEYS),
+            }
+
+        shortcuts = self._layout_shortcuts[layout]
+        if shortcuts is self._nav_shortcuts:
+            return
+
+        # Disable the old set before enabling the new one, so keys bound in
+        # both layouts are never enabled twice
+        for shortcut in self._nav_shortcuts.values():
+            shortcut.setEnabled(False)
+        self._nav_shortcuts = shortcuts
+        for shortcut in self._nav_shortcuts.values():
+            shortcut.setEnabled(True)
 
     def _on_layout_changed(self, layout: KeyboardLayout):
         """Handle layout preference change."""
         self._apply_layout(layout)
 
-    def _on_nav_shortcut(self, name: str):
-        """Handle navigation shortcut activation."""
-        # Section navigation
-        if name == 'section_next':
-            self._cycle_section(1)
-        elif name == 'section_prev':
-            self._cycle_section(-1)
-        elif name == 'section_grid':
-            self.go_to_section(Section.GRID)
-        elif name == 'section_emitter':
-            self.go_to_section(Section.EMITTER)
-        elif name == 'section_tracks':
-            self.go_to_section(Section.TRACKS)
-        elif name == 'section_global':
-            self.go_to_section(Section.GLOBAL)
-
-        # W/S navigation (navigate within section)
-        elif name == 'nav_prev':
-            self.navigate_prev()
-        elif name == 'nav_next':
-            self.navigate_next()
-
-        # Value adjustment (CONTROL mode) or grid horizontal movement (GRID section)
-        elif name == 'value_decrease':
-            if self._section == Section.GRID:
-                self.actionTriggered.emit('grid_left')
-            elif self._mode == NavigationMode.CONTROL:
-                self.valueAdjust.emit(-1)
-        elif name == 'value_increase':
-            if self._section == Section.GRID:
-                self.actionTriggered.emit('grid_right')
-            elif self._mode == NavigationMode.CONTROL:
-                self.valueAdjust.emit(1)
-        elif name == 'value_decrease_large':
-            if self._section == Section.GRID:
-                self.actionTriggered.emit('grid_left')
-            elif self._mode == NavigationMode.CONTROL:
-                self.valueAdjust.emit(-10)
-        elif name == 'value_increase_large':
-            if self._section == Section.GRID:
-                self.actionTriggered.emit('grid_right')
-            elif self._mode == NavigationMode.CONTROL:
-                self.valueAdjust.emit(10)
-
-        # Actions
-        elif name == 'toggle_focus':
-            self._toggle_focus()
-        elif name == 'toggle_cell':
-            self.actionTriggered.emit('toggle_cell')
-        elif name == 'reset_default':
-            self.actionTriggered.emit('reset_default')
-        elif name == 'toggle_envelope':
-            self.actionTriggered.emit('toggle_envelope')
+    def _adjust_value(self, delta: int):
+        """Adjust the focused value, or move the grid cursor in the GRID section."""
+        if self._section == Section.GRID:
+            self.actionTriggered.emit('grid_left' if delta < 0 else 'grid_right')
+        elif self._mode == NavigationMode.CONTROL:
+            self.valueAdjust.emit(delta)
 
     def _cycle_section(self, delta: int):
         """Cycle through sections."""
-        current_idx = self.SECTION_ORDER.index(self._section)
+        current_idx = self._SECTION_INDEX[self._section]
         new_idx = (current_idx + delta) % len(self.SECTION_ORDER)
         self.go_to_section(self.SECTION_ORDER[new_idx])
 
@@ -384,33 +351,22 @@ class NavigationManager(QObject):
 
     def _toggle_focus(self):
         """Toggle focus level - enter deeper or exit to shallower."""
-        if self._mode == NavigationMode.SECTION:
-            # Enter subsection mode
-            self._mode = NavigationMode.SUBSECTION
+        old_mode = self._mode
+        self._mode = self._FOCUS_TRANSITIONS[old_mode]
+        # Panels are told what got focus before the mode change itself
+        if old_mode == NavigationMode.SECTION:
+            # Entered subsection mode
             self.subsectionChanged.emit(self._subsection)
-        elif self._mode == NavigationMode.SUBSECTION:
-            # Enter control mode
-            self._mode = NavigationMode.CONTROL
+        elif old_mode == NavigationMode.SUBSECTION:
+            # Entered control mode
             self._control = 0
             self.controlChanged.emit(self._control)
-        elif self._mode == NavigationMode.CONTROL:
-            # Exit back to subsection mode
-            self._mode = NavigationMode.SUBSECTION
-        elif self._mode == NavigationMode.VALUE:
-            # Exit back to control mode
-            self._mode = NavigationMode.CONTROL
         self.modeChanged.emit(self._mode)
         self._update_path()
 
     def _update_path(self):
         """Update and emit the navigation path string."""
-        section_names = {
-            Section.GRID: 'Grid',
-            Section.EMITTER: 'Emitter',
-            Section.TRACKS: 'Tracks',
-            Section.GLOBAL: 'Global',
-        }
-        path = section_names[self._section]
+        path = self.SECTION_NAMES[self._section]
 
         if self._mode != NavigationMode.SECTION:
             # The actual subsection/control names come from the widgets
@@ -422,6 +378,12 @@ class NavigationManager(QObject):
             if self._mode == NavigationMode.VALUE:
                 path += ' [Adjusting]'
 
+        # Skip re-emitting an unchanged path (e.g. repeated clicks on the
+        # already focused section or control)
+        key = (self._mode, path)
+        if key == self._last_path:
+            return
+        self._last_path = key
         self.navigationPathChanged.emit(path)
 
     @property
@@ -437,8 +399,9 @@ class NavigationManager(QObject):
     @subsection.setter
     def subsection(self, value: int):
         """Set subsection index (used by widgets to sync state)."""
-        self._subsection = value
-        self._update_path()
+        if value != self._subsection:
+            self._subsection = value
+            self._update_path()
 
     @property
     def control(self) -> int:
@@ -448,8 +411,9 @@ class NavigationManager(QObject):
     @control.setter
     def control(self, value: int):
         """Set control index (used by widgets to sync state)."""
-        self._control = value
-        self._update_path()
+        if value != self._control:
+            self._control = value
+            self._update_path()
 
     @property
     def mode(self) -> NavigationMode:
@@ -529,6 +493,9 @@ class NavigationManager(QObject):
             section: The section containing the subsection
             subsection: The subsection index within the section
         """
+        if self._is_focused(section, subsection, 0, NavigationMode.SUBSECTION):
+            return
+
         section_changed = section != self._section
 
         self._section = section
@@ -554,6 +521,9 @@ class NavigationManager(QObject):
             subsection: The subsection index within the section
             control: The control index within the subsection
         """
+        if self._is_focused(section, subsection, control, NavigationMode.CONTROL):
+            return
+
         section_changed = section != self._section
 
         self._section = section
@@ -568,6 +538,18 @@ class NavigationManager(QObject):
         self.modeChanged.emit(self._mode)
         self._update_path()
 
+    def _is_focused(self, section: Section, subsection: int, control: int,
+                    mode: NavigationMode) -> bool:
+        """Check whether the navigation state already matches a focus target.
+
+        Lets repeated clicks on the focused item skip re-emitting every
+        focus signal. Only the full state is compared: the signals are not
+        filtered individually, since panels rely on e.g. controlChanged to
+        enter control mode even when the control index stays 0.
+        """
+        return (section == self._section and subsection == self._subsection
+                and control == self._control and mode == self._mode)
+
     # --- Section structure and navigation ---
 
     def register_section_structure(self, section: Section, control_counts: list[int]):
@@ -1,4 +1,6 @@
 """QSS styling constants for Tempera GUI."""
+from PySide6.QtWidgets import QWidget
+
 
 # Emitter colors (for cell grid and emitter selection)
 # Matches Tempera hardware: 1-Blue, 2-Yellow, 3-Pink, 4-Green
@@ -579,3 +581,13 @@ def get_transport_button_style(button_type: str) -> str:
                 background-color: #8A4A4A;
             }
         """
+
+
+def set_style_sheet(widget: QWidget, style: str):
+    """Apply a stylesheet unless the widget already has it.
+
+    Setting a stylesheet makes Qt reparse it and repolish the widget, so
+    idempotent style updates are skipped.
+    """
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
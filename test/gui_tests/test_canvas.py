@@ -163,6 +163,27 @@ class TestCanvasManager(unittest.TestCase):
         self.assertTrue(result)
         self.assertNotIn('to_delete', canvas_manager.list_canvases())
 
+    def test_identical_save_skips_write(self):
+        """Saving unchanged content again does not rewrite the file."""
+        canvas_manager.save_canvas('unchanged', {'x': 1}, {})
+        with patch('builtins.open') as mock_open:
+            canvas_manager.save_canvas('unchanged', {'x': 1}, {})
+        mock_open.assert_not_called()
+
+    def test_changed_save_rewrites(self):
+        """Saving different content rewrites the file."""
+        canvas_manager.save_canvas('changed', {'x': 1}, {})
+        canvas_manager.save_canvas('changed', {'x': 2}, {})
+        state, _ = canvas_manager.load_canvas('changed')
+        self.assertEqual(state, {'x': 2})
+
+    def test_save_after_delete_rewrites(self):
+        """A deleted canvas is written again even if content is unchanged."""
+        canvas_manager.save_canvas('recreated', {'x': 1}, {})
+        canvas_manager.delete_canvas('recreated')
+        canvas_manager.save_canvas('recreated', {'x': 1}, {})
+        self.assertIn('recreated', canvas_manager.list_canvases())
+
     def test_delete_nonexistent_returns_false(self):
         """Deleting non-existent canvas returns False."""
         self.assertFalse(canvas_manager.delete_canvas('nope'))
@@ -0,0 +1,347 @@
+"""EnvelopeCanvas rendering and drawing tests.
+
+Tests for the envelope canvas widget in isolation: cached paint geometry
+and mouse drawing.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from PySide6.QtCore import Qt, QPoint
+
+from gui.envelope.envelope import Envelope
+from test.gui_tests.base import GUITestCase
+
+
+class EnvelopeCanvasTestCase(GUITestCase):
+    """Base class providing a standalone, shown EnvelopeCanvas."""
+
+    def setUp(self):
+        """Create a canvas with an empty envelope (no main window needed)."""
+        from gui.envelope.envelope_panel import EnvelopeCanvas
+
+        self.canvas = EnvelopeCanvas()
+        self.canvas.resize(400, self.canvas.MIN_HEIGHT)
+        self.envelope = Envelope()
+        self.canvas.set_envelope(self.envelope)
+        self.canvas.show()
+
+    def tearDown(self):
+        """Dispose of the canvas."""
+        self.canvas.close()
+        self.canvas.deleteLater()
+
+    def paint(self):
+        """Force a synchronous paint of the canvas."""
+        self.canvas.grab()
+
+    def drag(self, *points: tuple[int, int]):
+        """Draw with the left mouse button through the given pixel positions."""
+        from PySide6.QtTest import QTest
+
+        first, *rest = points
+        QTest.mousePress(self.canvas, Qt.MouseButton.LeftButton, pos=QPoint(*first))
+        for pos in rest:
+            QTest.mouseMove(self.canvas, QPoint(*pos))
+        QTest.mouseRelease(self.canvas, Qt.MouseButton.LeftButton, pos=QPoint(*rest[-1] if rest else first))
+
+
+class TestCurvePolygonCache(EnvelopeCanvasTestCase):
+    """Tests for the cached envelope curve polyline."""
+
+    def test_polygon_reused_when_envelope_unchanged(self):
+        """Repainting an unchanged envelope reuses the cached polyline."""
+        self.envelope.add_point(0.0, 0.0)
+        self.envelope.add_point(1.0, 1.0)
+        self.paint()
+        polygon = self.canvas._curve_polygon
+        self.paint()
+        self.assertIs(self.canvas._curve_polygon, polygon)
+
+    def test_polygon_rebuilt_after_envelope_change(self):
+        """Modifying the envelope outside the canvas invalidates the polyline."""
+        self.envelope.add_point(0.25, 0.0)
+        self.paint()
+        self.envelope.add_point(0.5, 1.0)
+        self.paint()
+        self.assertEqual(self.canvas._curve_polygon.size(), 2)
+
+    def test_polygon_kept_when_same_envelope_set(self):
+        """Re-setting the displayed envelope keeps the cached polyline."""
+        self.envelope.add_point(0.25, 0.5)
+        self.paint()
+        polygon = self.canvas._curve_polygon
+        self.canvas.set_envelope(self.envelope)
+        self.paint()
+        self.assertIs(self.canvas._curve_polygon, polygon)
+
+    def test_polygon_rebuilt_for_other_envelope(self):
+        """Switching to another envelope rebuilds the polyline."""
+        self.envelope.add_point(0.25, 0.5)
+        self.paint()
+        other = Envelope()
+        other.add_point(0.5, 0.5)
+        other.add_point(0.75, 0.5)
+        self.canvas.set_envelope(other)
+        self.paint()
+        self.assertEqual(self.canvas._curve_polygon.size(), 2)
+
+    def test_polygon_rebuilt_after_resize(self):
+        """Resizing the canvas invalidates the polyline."""
+        self.envelope.add_point(0.5, 0.5)
+        self.paint()
+        polygon = self.canvas._curve_polygon
+        self.canvas.resize(300, self.canvas.MIN_HEIGHT)
+        self.paint()
+        self.assertIsNot(self.canvas._curve_polygon, polygon)
+
+    def test_drag_extends_cached_polygon(self):
+        """Drawing forward in time appends to the cached polyline in place."""
+        self.drag((20, 40), (100, 30), (200, 20))
+        self.paint()
+        self.assertEqual(len(self.envelope.points), 3)
+        self.assertEqual(self.canvas._curve_polygon.size(), 3)
+        self.assertEqual(self.canvas._curve_version, self.envelope.version)
+
+    def test_dense_envelope_decimated_to_width(self):
+        """Envelopes with more points than pixel columns are thinned out."""
+        for i in range(2000):
+            self.envelope.add_point(i / 1999, (i % 7) / 6)
+        self.paint()
+        polygon = self.canvas._curve_polygon
+        width = self.canvas._canvas_rect().width()
+        self.assertLessEqual(polygon.size(), width + 1)
+        last = self.canvas._point_to_canvas(1.0, self.envelope.points[-1].value)
+        self.assertAlmostEqual(polygon.last().x(), last.x())
+        self.assertAlmostEqual(polygon.last().y(), last.y())
+
+    def test_flush_keeps_dense_polygon_decimated(self):
+        """Appending drawn points doesn't grow a decimated polyline past the width."""
+        for i in range(4000):
+            self.envelope.add_point(i / 7999, (i % 7) / 6)
+        self.paint()
+        self.canvas._pending_points.extend((0.5 + i / 400, 0.5) for i in range(1, 150))
+        self.canvas._flush_pending()
+        self.paint()
+        width = self.canvas._canvas_rect().width()
+        self.assertLessEqual(self.canvas._curve_polygon.size(), width + 1)
+
+    def test_sparse_envelope_not_decimated(self):
+        """Envelopes with fewer points than pixel columns draw every point."""
+        for i in range(50):
+            self.envelope.add_point(i / 49, 0.5)
+        self.paint()
+        self.assertEqual(self.canvas._curve_polygon.size(), 50)
+
+
+class TestPointConversion(EnvelopeCanvasTestCase):
+    """Tests for envelope-to-canvas coordinate conversion."""
+
+    def test_batch_matches_single_point(self):
+        """Batch conversion agrees with the per-point conversion."""
+        pairs = [(0.0, 0.0), (0.25, 0.8), (0.5, 0.5), (1.0, 1.0)]
+        batch = self.canvas._points_to_canvas(pairs)
+        for (time, value), point in zip(pairs, batch):
+            single = self.canvas._point_to_canvas(time, value)
+            self.assertAlmostEqual(point.x(), single.x())
+            self.assertAlmostEqual(point.y(), single.y())
+
+    def test_canvas_to_point_inverts_point_to_canvas(self):
+        """Canvas-to-envelope conversion round-trips, with or without a drag."""
+        from PySide6.QtTest import QTest
+
+        pos = self.canvas._point_to_canvas(0.3, 0.7)
+        time, value = self.canvas._canvas_to_point(pos)
+        self.assertAlmostEqual(time, 0.3)
+        self.assertAlmostEqual(value, 0.7)
+
+        QTest.mousePress(self.canvas, Qt.MouseButton.LeftButton, pos=QPoint(20, 40))
+        self.assertIsNotNone(self.canvas._drag_transform)
+        time, value = self.canvas._canvas_to_point(pos)
+        self.assertAlmostEqual(time, 0.3)
+        self.assertAlmostEqual(value, 0.7)
+        QTest.mouseRelease(self.canvas, Qt.MouseButton.LeftButton, pos=QPoint(20, 40))
+        self.assertIsNone(self.canvas._drag_transform)
+
+
+class TestGridPathCache(EnvelopeCanvasTestCase):
+    """Tests for the cached grid line path."""
+
+    def test_grid_path_reused_between_paints(self):
+        """Painting does not rebuild the grid."""
+        self.paint()
+        path = self.canvas._grid_path
+        self.paint()
+        self.assertIs(self.canvas._grid_path, path)
+
+    def test_grid_path_follows_resize(self):
+        """Resizing rebuilds the grid to span the new canvas rect."""
+        self.canvas.resize(600, self.canvas.MIN_HEIGHT)
+        rect = self.canvas._canvas_rect()
+        bounds = self.canvas._grid_path.boundingRect()
+        self.assertAlmostEqual(bounds.left(), rect.x())
+        self.assertAlmostEqual(bounds.right(), rect.right())
+        # 7 vertical + 1 horizontal line, two elements each
+        self.assertEqual(self.canvas._grid_path.elementCount(), 16)
+
+
+class TestDrawThrottling(EnvelopeCanvasTestCase):
+    """Tests for coalescing mouse moves while drawing."""
+
+    def setUp(self):
+        super().setUp()
+        self.changes = []
+        self.canvas.envelopeChanged.connect(self.changes.append)
+
+    def press_and_move(self, *points: tuple[int, int]):
+        from PySide6.QtTest import QTest
+
+        first, *rest = points
+        QTest.mousePress(self.canvas, Qt.MouseButton.LeftButton, pos=QPoint(*first))
+        for pos in rest:
+            QTest.mouseMove(self.canvas, QPoint(*pos))
+
+    def test_hover_moves_not_tracked(self):
+        """Moves without a button pressed are not delivered to the canvas."""
+        self.assertFalse(self.canvas.hasMouseTracking())
+
+    def test_moves_buffered_until_timer(self):
+        """Mouse moves do not touch the envelope until the throttle fires."""
+        self.press_and_move((20, 40), (60, 30), (100, 20), (140, 10))
+        self.assertEqual(len(self.envelope.points), 1)
+        self.assertEqual(len(self.changes), 1)  # press only
+        self.assertTrue(self.canvas._throttle_timer.isActive())
+
+        self.canvas._throttle_timer.timeout.emit()
+        self.assertEqual(len(self.envelope.points), 4)
+        self.assertEqual(len(self.changes), 2)
+
+    def test_release_flushes_pending(self):
+        """Releasing the mouse commits buffered points immediately."""
+        self.drag((20, 40), (60, 30), (100, 20))
+        self.assertEqual(len(self.envelope.points), 3)
+        self.assertEqual(len(self.changes), 2)
+        self.assertFalse(self.canvas._throttle_timer.isActive())
+
+    def test_backward_moves_ignored(self):
+        """Only points moving forward in time are buffered."""
+        self.press_and_move((100, 40), (80, 30), (140, 20), (120, 10))
+        self.assertEqual(len(self.canvas._pending_points), 1)
+
+    def test_release_schedules_final_repaint(self):
+        """Releasing repaints even with nothing buffered (antialiased redraw)."""
+        from PySide6.QtTest import QTest
+
+        self.press_and_move((20, 40))
+        with patch.object(self.canvas, 'update') as update:
+            QTest.mouseRelease(self.canvas, Qt.MouseButton.LeftButton, pos=QPoint(20, 40))
+        self.assertFalse(self.canvas._drawing)
+        update.assert_called_once_with()
+
+    def test_tiny_moves_dropped(self):
+        """Moves too small in both time and value are not added."""
+        self.press_and_move((100, 40), (101, 40), (110, 40))
+        # Canvas is 384 px wide: 1 px is below MIN_DRAW_DT, 10 px is not
+        self.assertEqual(len(self.canvas._pending_points), 1)
+
+    def test_steep_moves_kept(self):
+        """A small time step with a large value change is kept."""
+        self.press_and_move((100, 60), (101, 20))
+        self.assertEqual(len(self.canvas._pending_points), 1)
+
+    def test_set_envelope_flushes_to_previous(self):
+        """Switching envelopes mid-drag keeps drawn points on the old one."""
+        self.press_and_move((20, 40), (60, 30))
+        self.canvas.set_envelope(Envelope())
+        self.assertEqual(len(self.envelope.points), 2)
+
+
+class TestBackgroundCache(EnvelopeCanvasTestCase):
+    """Tests for the pre-rendered frame and grid background."""
+
+    def test_background_reused_between_paints(self):
+        """Repainting reuses the same background pixmap."""
+        self.paint()
+        background = self.canvas._background
+        self.assertIsNotNone(background)
+        self.paint()
+        self.assertIs(self.canvas._background, background)
+
+    def test_background_rerendered_after_resize(self):
+        """Resizing renders a background at the new size."""
+        self.paint()
+        self.canvas.resize(250, self.canvas.MIN_HEIGHT)
+        self.paint()
+        self.assertEqual(self.canvas._background.width(), 250 * self.canvas.devicePixelRatioF())
+
+    def test_background_rerendered_after_style_change(self):
+        """Changing the enabled border color invalidates the background."""
+        self.paint()
+        self.canvas.set_enabled(True)
+        self.assertIsNone(self.canvas._background)
+
+
+class TestPlayheadRepaint(EnvelopeCanvasTestCase):
+    """Tests for partial repaints when the playhead moves."""
+
+    def set_position(self, position):
+        """Set the playhead position and return the rects repainted."""
+        with patch.object(self.canvas, 'update') as update:
+            self.canvas.set_playhead_position(position)
+        return [call.args[0] for call in update.call_args_list]
+
+    def test_first_position_updates_new_strip(self):
+        """Showing the playhead repaints only a narrow strip around it."""
+        rects = self.set_position(0.5)
+        self.assertEqual(len(rects), 1)
+        x = self.canvas._playhead_x(0.5)
+        self.assertTrue(rects[0].contains(x, 0))
+        self.assertLess(rects[0].width(), 10)
+        self.assertEqual(rects[0].height(), self.canvas.height())
+
+    def test_move_updates_old_and_new_strips(self):
+        """Moving the playhead repaints where it was and where it is."""
+        self.set_position(0.1)
+        old_x = self.canvas._playhead_x(0.1)
+        rects = self.set_position(0.9)
+        new_x = self.canvas._playhead_x(0.9)
+        self.assertEqual(len(rects), 2)
+        self.assertTrue(rects[0].contains(old_x, 0))
+        self.assertTrue(rects[1].contains(new_x, 0))
+
+    def test_same_pixel_skips_repaint(self):
+        """A sub-pixel move does not repaint."""
+        self.set_position(0.5)
+        self.assertEqual(self.set_position(0.5001), [])
+        self.assertEqual(self.canvas._playhead_position, 0.5001)
+
+    def test_hide_updates_old_strip(self):
+        """Hiding the playhead repaints the strip it occupied."""
+        self.set_position(0.5)
+        rects = self.set_position(None)
+        self.assertEqual(len(rects), 1)
+        self.assertTrue(rects[0].contains(self.canvas._playhead_x(0.5), 0))
+        self.assertEqual(self.set_position(None), [])
+
+
+class TestCanvasStyle(EnvelopeCanvasTestCase):
+    """Tests for the enabled/disabled frame style."""
+
+    def test_style_follows_enabled_state(self):
+        """The frame stylesheet switches between the two static styles."""
+        from gui.envelope.envelope_panel import CANVAS_STYLE_ENABLED, CANVAS_STYLE_DISABLED
+
+        self.assertEqual(self.canvas.styleSheet(), CANVAS_STYLE_DISABLED)
+        self.canvas.set_enabled(True)
+        self.assertEqual(self.canvas.styleSheet(), CANVAS_STYLE_ENABLED)
+
+    def test_unchanged_style_not_reapplied(self):
+        """Re-applying the same enabled state does not reset the stylesheet."""
+        with patch.object(self.canvas, 'setStyleSheet') as set_style:
+            self.canvas.set_enabled(False)
+            self.canvas.set_envelope(Envelope())
+        set_style.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,8 @@ for the currently focused control.
 """
 
 import unittest
+from PySide6.QtCore import Qt, QPoint
+from PySide6.QtTest import QTest
 from gui.shortcuts import Section, NavigationMode
 from test.gui_tests.base import GUITestCase
 
@@ -281,5 +283,70 @@ class TestModulatorEnvelopeBehavior(GUITestCase):
         self.assertEqual(envelope5.display_name, 'Modulator 5')
 
 
+class TestEnvelopeDrawingUndo(GUITestCase):
+    """Tests for undo recording while drawing an envelope."""
+
+    def test_stroke_records_single_undo_step(self):
+        """A whole drawing stroke is undone in one step."""
+        self.harness.click_control(Section.EMITTER, subsection=0, control=0)
+        panel = self.harness.window._envelope_panel
+        panel.toggle_enabled()  # ENV on selects the pencil
+        state = self.harness.adapter.state
+        canvas = panel._canvas
+        undo_depth = len(state._undo_stack)
+
+        QTest.mousePress(canvas, Qt.MouseButton.LeftButton, pos=QPoint(20, 40))
+        for x in range(40, 200, 20):
+            QTest.mouseMove(canvas, QPoint(x, 30))
+            canvas._flush_pending()
+        QTest.mouseRelease(canvas, Qt.MouseButton.LeftButton, pos=QPoint(200, 30))
+
+        envelope = state.get_envelope('emitter.1.volume')
+        self.assertEqual(len(envelope.points), 9)
+        self.assertEqual(len(state._undo_stack), undo_depth + 1)
+
+
+    def test_clear_mid_stroke_records_own_undo_step(self):
+        """Right-click clearing during a stroke is undone separately."""
+        self.harness.click_control(Section.EMITTER, subsection=0, control=0)
+        panel = self.harness.window._envelope_panel
+        panel.toggle_enabled()
+        state = self.harness.adapter.state
+        canvas = panel._canvas
+        undo_depth = len(state._undo_stack)
+
+        QTest.mousePress(canvas, Qt.MouseButton.LeftButton, pos=QPoint(20, 40))
+        QTest.mouseMove(canvas, QPoint(60, 30))
+        canvas._flush_pending()
+        QTest.mousePress(canvas, Qt.MouseButton.RightButton, pos=QPoint(60, 30))
+
+        self.assertFalse(panel.is_drawing)
+        self.assertEqual(len(state.get_envelope('emitter.1.volume').points), 0)
+        self.assertEqual(len(state._undo_stack), undo_depth + 2)
+
+
+class TestEnvelopeControlSwitchMidStroke(GUITestCase):
+    """Tests for switching the envelope panel's control while drawing."""
+
+    def test_buffered_points_stay_with_drawn_control(self):
+        """Points buffered before a control switch are saved to the old control."""
+        self.harness.click_control(Section.EMITTER, subsection=0, control=0)
+        panel = self.harness.window._envelope_panel
+        panel.toggle_enabled()
+        canvas = panel._canvas
+        emitted = []
+        panel.envelopeChanged.connect(lambda key, envelope: emitted.append(key))
+
+        QTest.mousePress(canvas, Qt.MouseButton.LeftButton, pos=QPoint(20, 40))
+        QTest.mouseMove(canvas, QPoint(60, 30))
+        self.harness.press_key(Qt.Key.Key_2)  # Switch to emitter 2 before the flush
+        self.assertEqual(panel.current_control_key, 'emitter.2.volume')
+
+        self.assertEqual(emitted, ['emitter.1.volume', 'emitter.1.volume'])
+        state = self.harness.adapter.state
+        self.assertEqual(len(state.get_envelope('emitter.1.volume').points), 2)
+        self.assertEqual(len(state.get_envelope('emitter.2.volume').points), 0)
+        self.assertFalse(panel.is_drawing)
+
 if __name__ == '__main__':
     unittest.main()
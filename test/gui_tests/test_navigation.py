@@ -5,6 +5,9 @@ and signal chain verification.
 """
 
 import unittest
+from unittest.mock import patch
+from PySide6.QtCore import Qt
+from gui.preferences import KeyboardLayout
 from gui.shortcuts import Section, NavigationMode
 from test.gui_tests.base import GUITestCase
 
@@ -380,6 +383,25 @@ class TestSubsectionClickFocus(GUITestCase):
         self.harness.assert_mode(NavigationMode.SUBSECTION)
         self.harness.assert_focus(Section.GLOBAL, subsection=1)
 
+    def test_click_focused_subsection_emits_nothing(self):
+        """Clicking the already focused subsection emits no focus signals."""
+        self.harness.click_subsection(Section.EMITTER, 2)
+        nav = self.harness.window._nav
+        emitted = []
+        nav.subsectionChanged.connect(emitted.append)
+        nav.modeChanged.connect(emitted.append)
+
+        self.harness.click_subsection(Section.EMITTER, 2)
+        self.assertEqual(emitted, [])
+
+    def test_click_first_control_from_subsection_enters_control_mode(self):
+        """Clicking control 0 of the focused subsection still enters CONTROL mode."""
+        self.harness.click_subsection(Section.EMITTER, 2)
+        self.harness.click_control(Section.EMITTER, 2, 0)
+        self.harness.assert_mode(NavigationMode.CONTROL)
+        panel = self.harness.get_panel_state(Section.EMITTER)
+        self.assertTrue(panel.in_control_mode)
+
 
 class TestSectionClickNavigation(GUITestCase):
     """Tests for section clicks updating NavigationManager."""
@@ -545,5 +567,108 @@ class TestValueAdjustment(GUITestCase):
         self.assertEqual(self.harness.window._track_panel.get_volume(1), initial_volume + 1)
 
 
+class TestGlobalActionShortcuts(GUITestCase):
+    """Tests that global action shortcuts are bound once and actually fire."""
+
+    def test_global_action_keys_not_ambiguous(self):
+        """Escape and undo/redo keys each trigger their action."""
+        nav = self.harness.window._nav
+        fired = []
+        for name in ('stop', 'undo', 'redo'):
+            nav.set_callback(name, lambda n=name: fired.append(n))
+
+        for key in ('Escape', 'Ctrl+Z', 'Ctrl+Shift+Z'):
+            self.harness.press_shortcut(key)
+
+        self.assertEqual(fired, ['stop', 'undo', 'redo'])
+
+    def test_file_menu_owns_save_load_keys(self):
+        """Ctrl+S / Ctrl+O trigger the File menu actions, which show the keys."""
+        actions = {action.text(): action
+                   for action in self.harness.window.menuBar().actions()[0].menu().actions()}
+        self.assertEqual(actions['&Save Canvas...'].shortcut().toString(), 'Ctrl+S')
+        self.assertEqual(actions['&Load Canvas...'].shortcut().toString(), 'Ctrl+O')
+
+        with patch('gui.app.QInputDialog.getText', return_value=('', False)) as get_text, \
+                patch('gui.canvas_manager.list_canvases', return_value=[]), \
+                patch('gui.app.QMessageBox.information') as info:
+            self.harness.press_shortcut('Ctrl+S')
+            self.harness.press_shortcut('Ctrl+O')
+        get_text.assert_called_once()
+        info.assert_called_once()
+
+
+class TestNavigationPath(GUITestCase):
+    """Tests for navigationPathChanged emissions."""
+
+    def setUp(self):
+        super().setUp()
+        self.paths = []
+        self.harness.window._nav.navigationPathChanged.connect(self.paths.append)
+
+    def test_unchanged_path_not_reemitted(self):
+        """Re-focusing the current control does not emit the path again."""
+        self.harness.click_subsection(Section.EMITTER, 1)
+        self.harness.press_shortcut('F')  # Control mode
+        emitted = len(self.paths)
+
+        self.harness.window._nav.focus_control(Section.EMITTER, 1, 0)
+        self.assertEqual(len(self.paths), emitted)
+
+    def test_mode_change_emits_same_path(self):
+        """Entering SUBSECTION mode re-emits a path that reads the same."""
+        self.harness.press_shortcut('E')
+        self.harness.press_shortcut('F')  # Subsection 0: still just 'Emitter'
+        self.assertEqual(self.paths[-2:], ['Emitter', 'Emitter'])
+
+
+class TestLayoutSwitching(GUITestCase):
+    """Tests for switching between keyboard layouts."""
+
+    def setUp(self):
+        super().setUp()
+        self.nav = self.harness.window._nav
+        self.addCleanup(self.nav._apply_layout, self.nav._prefs.keyboard_layout)
+
+    def test_switch_layout_rebinds_keys(self):
+        """After switching, only the new layout's keys navigate."""
+        self.nav._apply_layout(KeyboardLayout.RIGHT_HAND)
+        self.harness.press_shortcut('G')
+        self.harness.assert_focus(Section.GRID)
+        self.harness.press_key(Qt.Key.Key_End)
+        self.harness.assert_focus(Section.GLOBAL)
+
+        self.nav._apply_layout(KeyboardLayout.LEFT_HAND)
+        self.harness.press_key(Qt.Key.Key_End)
+        self.harness.assert_focus(Section.GLOBAL)
+        self.harness.press_shortcut('E')
+        self.harness.assert_focus(Section.EMITTER)
+
+    def test_switch_layout_reuses_shortcuts(self):
+        """Switching back and forth does not create new shortcuts."""
+        self.nav._apply_layout(KeyboardLayout.RIGHT_HAND)
+        shortcut = self.nav._nav_shortcuts['nav_prev']
+        self.nav._apply_layout(KeyboardLayout.LEFT_HAND)
+        self.nav._apply_layout(KeyboardLayout.RIGHT_HAND)
+        self.assertIs(self.nav._nav_shortcuts['nav_prev'], shortcut)
+
+    def test_reapplying_active_layout_is_noop(self):
+        """Applying the already active layout leaves its shortcuts alone."""
+        self.nav._apply_layout(KeyboardLayout.LEFT_HAND)
+        shortcut = self.nav._nav_shortcuts['nav_prev']
+        with patch.object(shortcut, 'setEnabled') as set_enabled:
+            self.nav._apply_layout(KeyboardLayout.LEFT_HAND)
+        set_enabled.assert_not_called()
+
+    def test_key_shared_by_layouts_fires_once(self):
+        """A key bound in both layouts triggers its action once."""
+        actions = []
+        self.nav.actionTriggered.connect(actions.append)
+        self.nav._apply_layout(KeyboardLayout.RIGHT_HAND)
+        self.nav._apply_layout(KeyboardLayout.LEFT_HAND)
+        self.harness.press_shortcut('R')
+        self.assertEqual(actions, ['toggle_envelope'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -105,6 +105,55 @@ class TestEnvelope(unittest.TestCase):
         env.clear()
         self.assertTrue(env.is_empty())
 
+    def test_add_points(self):
+        """Test batch adding matches adding points one by one."""
+        pairs = [(0.5, 0.5), (0.0, 1.5), (1.2, -0.1), (0.25, 0.3)]
+        batch = Envelope()
+        batch.add_points(pairs)
+        single = Envelope()
+        for time, value in pairs:
+            single.add_point(time, value)
+        self.assertEqual(batch.points, single.points)
+        self.assertEqual(batch.get_value_at(0.4), single.get_value_at(0.4))
+
+    def test_append_in_order_extends_lookups(self):
+        """Test appending later points keeps cached lookups in step."""
+        env = Envelope()
+        env.add_point(0.0, 0.0)
+        env.add_point(0.5, 1.0)
+        times, values = env.times_and_values()
+        env.add_points([(0.75, 0.5), (1.0, 0.0)])
+        # Extended in place rather than rebuilt
+        self.assertIs(env.times_and_values()[0], times)
+        self.assertEqual(times, [0.0, 0.5, 0.75, 1.0])
+        self.assertAlmostEqual(env.get_value_at(0.875), 0.25)
+        self.assertAlmostEqual(env.get_value_at(0.25), 0.5)
+
+    def test_times_and_values(self):
+        """Test parallel time/value lists track the sorted points."""
+        env = Envelope()
+        env.add_point(0.75, 0.2)
+        env.add_point(0.25, 0.8)
+        self.assertEqual(env.times_and_values(), ([0.25, 0.75], [0.8, 0.2]))
+
+        env.add_point(0.5, 0.5)
+        self.assertEqual(env.times_and_values(), ([0.25, 0.5, 0.75], [0.8, 0.5, 0.2]))
+
+        env.clear()
+        self.assertEqual(env.times_and_values(), ([], []))
+
+    def test_version_increments_on_change(self):
+        """Test the modification counter changes with the points."""
+        env = Envelope()
+        start = env.version
+        env.add_point(0.5, 0.5)
+        self.assertGreater(env.version, start)
+        after_add = env.version
+        env.get_value_at(0.3)
+        self.assertEqual(env.version, after_add)
+        env.clear()
+        self.assertGreater(env.version, after_add)
+
     def test_enabled_state(self):
         """Test enabled/disabled state."""
         env = Envelope()
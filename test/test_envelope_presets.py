@@ -105,6 +105,13 @@ class TestEnvelopePresets(unittest.TestCase):
         self.assertEqual(len(mid), 1)
         self.assertEqual(mid[0][1], 1.0)
 
+    def test_points_cached_and_immutable(self):
+        """Repeated calls share one immutable result per preset and mode."""
+        points = generate_preset_points(EnvelopePreset.ROUNDED, per_cell=True)
+        self.assertIsInstance(points, tuple)
+        self.assertIs(generate_preset_points(EnvelopePreset.ROUNDED, per_cell=True), points)
+        self.assertIsNot(generate_preset_points(EnvelopePreset.ROUNDED, per_cell=False), points)
+
 
 class TestEnvelopeMIDIApplication(unittest.TestCase):
     """Tests for applying presets to MIDI values."""
@@ -212,5 +219,29 @@ class TestEnvelopeMIDIApplication(unittest.TestCase):
         self.assertEqual(result, 100)  # Should return base value unchanged
 
 
+class TestEnvelopeManagerTickCallback(unittest.TestCase):
+    """Tests for tick callback wiring through the tickUpdate signal."""
+
+    def test_callback_receives_tick_position(self):
+        """The tick callback is invoked with the emitted position."""
+        manager = EnvelopeManager(bpm=120)
+        received = []
+        manager.set_tick_callback(received.append)
+        manager.tickUpdate.emit(0.25)
+        self.assertEqual(received, [0.25])
+
+    def test_replacing_callback_disconnects_previous(self):
+        """Setting a new callback (or None) disconnects the old one."""
+        manager = EnvelopeManager(bpm=120)
+        first, second = [], []
+        manager.set_tick_callback(first.append)
+        manager.set_tick_callback(second.append)
+        manager.tickUpdate.emit(0.5)
+        manager.set_tick_callback(None)
+        manager.tickUpdate.emit(0.75)
+        self.assertEqual(first, [])
+        self.assertEqual(second, [0.5])
+
+
 if __name__ == '__main__':
     unittest.main()